@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""출석 비트맵 - 시작일부터 오늘까지 하루 1칸짜리 배열과 누적합으로 출석 통계를 O(1)에 조회
+
+    solved[i]    : 시작일 + i일에 문제를 풀었으면 1
+    business[i]  : 시작일 + i일이 출석 평가일(평일 - 휴일/면제일)이면 1
+    *_prefix[i]  : 위 배열의 앞 i칸 합 (구간 개수 = 두 값의 차)
+    streaks[i]   : i일까지 이어진 연속 출석 평가일 수 (평가일이 아닌 날은 끊지 않고 이어감)
+    best[i]      : i일까지의 최장 연속 출석
+"""
+from array import array
+from datetime import date, timedelta
+from itertools import accumulate
+
+# 평일 하루 빠지면 1,000원 (README 스터디 규칙)
+FINE_PER_DAY = 1000
+
+
+class Attendance:
+    """참여자 한 명의 날짜별 출석 기록"""
+
+    __slots__ = ('start', 'today', 'solved', 'business', 'solved_prefix', 'business_prefix', 'streaks', 'best')
+
+    def __init__(self, start, today, solved, business):
+        self.start = start
+        self.today = today
+        self.solved = solved
+        self.business = business
+        # 평가일에 푼 날만 출석으로 침
+        attended = bytes(s & b for s, b in zip(solved, business))
+        self.solved_prefix = array('I', accumulate(attended, initial=0))
+        self.business_prefix = array('I', accumulate(business, initial=0))
+
+        self.streaks = array('I', [0]) * len(solved)
+        self.best = array('I', [0]) * len(solved)
+        streak = best = 0
+        for i, is_business in enumerate(business):
+            if is_business:
+                streak = streak + 1 if attended[i] else 0
+                best = max(best, streak)
+            self.streaks[i] = streak
+            self.best[i] = best
+
+    @classmethod
+    def from_ordinals(cls, solve_days, today, calendar, username=None):
+        """풀이 날짜들의 일 번호(date.toordinal)로 출석 기록 생성 (풀이가 없거나 시작일이 미래면 None)"""
+        last = today.toordinal()
+        solve_days = [day for day in solve_days if day <= last]
+        if not solve_days:
+            return None
+        first = min(solve_days)
+        start = date.fromordinal(first)
+        days = last - first + 1
+
+        # 요일 패턴(월~금 1, 토/일 0)을 반복해서 채운 뒤 휴일/면제일만 지움
+        weekday = start.weekday()
+        week = bytes(1 if (weekday + offset) % 7 < 5 else 0 for offset in range(7))
+        business = bytearray(week * (days // 7 + 1))[:days]
+        for day in calendar.exempt_days(start, today, username):
+            business[day.toordinal() - first] = 0
+
+        solved = bytearray(days)
+        for day in solve_days:
+            solved[day - first] = 1
+        return cls(start, today, solved, business)
+
+    def _index(self, day):
+        """날짜 -> 배열 위치 (범위 밖이면 양 끝으로 맞춤)"""
+        return min(max((day - self.start).days, -1), len(self.solved) - 1)
+
+    def business_days(self, first=None, last=None):
+        """first ~ last (양 끝 포함) 평가일 수"""
+        i = self._index(first or self.start)
+        j = self._index(last or self.today)
+        return self.business_prefix[j + 1] - self.business_prefix[max(i, 0)] if j >= i else 0
+
+    def attended_days(self, first=None, last=None):
+        """first ~ last (양 끝 포함) 문제를 푼 평가일 수"""
+        i = self._index(first or self.start)
+        j = self._index(last or self.today)
+        return self.solved_prefix[j + 1] - self.solved_prefix[max(i, 0)] if j >= i else 0
+
+    def _pending(self, day):
+        """오늘이 평가일인데 아직 안 풀었으면 1 (오늘은 새벽 4시까지 제출 가능)"""
+        if day != self.today:
+            return 0
+        i = self._index(day)
+        return 1 if self.business[i] and not self.solved[i] else 0
+
+    def missed_days(self, as_of=None):
+        """시작일 ~ as_of 사이 빼먹은 평가일 수"""
+        day = as_of or self.today
+        if day < self.start:
+            return 0
+        return self.business_days(None, day) - self.attended_days(None, day) - self._pending(day)
+
+    def success_rate(self, as_of=None):
+        """as_of 시점의 출석률 (%)"""
+        day = as_of or self.today
+        attended = self.attended_days(None, day) if day >= self.start else 0
+        evaluated = attended + self.missed_days(day)
+        return attended / evaluated * 100 if evaluated > 0 else 0
+
+    def fine(self, as_of=None):
+        """as_of 시점까지 쌓인 벌금 (원)"""
+        return self.missed_days(as_of) * FINE_PER_DAY
+
+    def current_streak(self, as_of=None):
+        """as_of 시점에 이어지고 있는 연속 출석 일수 (아직 안 푼 오늘은 끊지 않음)"""
+        day = as_of or self.today
+        if day < self.start:
+            return 0
+        i = self._index(day)
+        if self._pending(day):
+            return self.streaks[i - 1] if i > 0 else 0
+        return self.streaks[i]
+
+    def longest_streak(self, as_of=None):
+        """as_of 시점까지의 최장 연속 출석 일수"""
+        day = as_of or self.today
+        return self.best[self._index(day)] if day >= self.start else 0
+
+    def recent_missed(self, limit=5):
+        """최근 빼먹은 평가일 (최대 limit개, 오래된 순, 오늘 제외)"""
+        recent = []
+        count = min(limit, self.missed_days())
+        i = len(self.solved) - 2
+        while len(recent) < count and i >= 0:
+            if self.business[i] and not self.solved[i]:
+                recent.append(self.start + timedelta(days=i))
+            i -= 1
+        recent.reverse()
+        return recent
+
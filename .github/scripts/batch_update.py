@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""여러 스터디 저장소 일괄 갱신 - 저장소마다 update_readme.py를 프로세스 풀에서 독립 실행
+
+사용 예:
+    python .github/scripts/batch_update.py ../study-a ../study-b --summary groups.json
+    python .github/scripts/batch_update.py --roots-file roots.txt --jobs 4 -- --incremental --sharded
+
+`--` 뒤의 옵션은 그대로 각 저장소의 update_readme.py에 전달된다 (상대 경로는 각 저장소 기준).
+작업 프로세스가 저장소 폴더로 이동한 뒤 단독 실행과 같은 run()을 호출하므로 생성되는 파일은
+각 저장소에서 직접 실행한 결과와 같다. 한 저장소의 실패는 다른 저장소에 영향을 주지 않고,
+로그는 저장소별로 모아서 끝난 순서대로 출력한다.
+"""
+import argparse
+import io
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+
+from readme_state import run_git
+from readme_writer import changed_files
+from run_metrics import QUIET, log
+
+SUMMARY_VERSION = 1
+# 일괄 실행에서는 저장소 단위로 병렬화하므로 저장소 안의 스캔 스레드는 기본 1개
+DEFAULT_ARGS = ['--workers', '1']
+# 단독 실행 전용 옵션 (대화형이거나 한 저장소의 git 훅/검증 용도)
+UNSUPPORTED_OPTIONS = ('watch', 'hook', 'install_hook', 'verify_ledger')
+LEADERBOARD_SIZE = 20
+
+
+def group_stats(users_data):
+    """users_data -> 요약에 넣을 사용자별 통계 (프로세스 간에 넘길 수 있는 dict)"""
+    users = {}
+    for username, user_data in users_data.items():
+        stats = user_data.stats or {}
+        users[username] = {
+            'problems': user_data.total_count,
+            'first_date': stats.get('first_date'),
+            'success_days': stats.get('success_days', 0),
+            'failure_days': stats.get('failure_days', 0),
+            'success_rate': round(stats.get('success_rate', 0), 1),
+            'current_streak': stats.get('current_streak', 0),
+            'longest_streak': stats.get('longest_streak', 0),
+            'fine': stats.get('fine', 0),
+            'last_update': user_data.last_update,
+        }
+    return users
+
+
+def check_repo(root):
+    """스터디 저장소로 쓸 수 없는 경로면 ValueError (git 저장소가 아니거나 README.md 없음)"""
+    if run_git(['rev-parse', '--show-toplevel'], root) is None:
+        raise ValueError(f"git 저장소가 아님: {root}")
+    if not (Path(root) / 'README.md').is_file():
+        raise ValueError(f"README.md 없음: {root}")
+
+
+def update_repo(root, argv):
+    """저장소 하나를 갱신하고 결과 dict 반환 (작업 프로세스에서 실행, 예외는 결과에 기록)"""
+    import update_readme
+
+    result = {'root': root, 'ok': False, 'mode': None, 'changed_files': [], 'users': {}, 'error': None}
+    output = io.StringIO()
+    started = time.perf_counter()
+    with redirect_stdout(output), redirect_stderr(output):
+        try:
+            check_repo(root)
+            os.chdir(root)
+            args = update_readme.parse_args(argv)
+            update_readme.prepare_run(args)
+            mode, users_data = update_readme.run(args)
+            result.update(ok=True, mode=mode, changed_files=list(changed_files), users=group_stats(users_data))
+        except Exception as e:
+            traceback.print_exc()
+            result['error'] = f"{type(e).__name__}: {e}"
+    result['seconds'] = round(time.perf_counter() - started, 3)
+    result['log'] = output.getvalue()
+    return result
+
+
+def failed_result(root, error):
+    """작업 프로세스 자체가 죽은 경우의 결과"""
+    return {'root': root, 'ok': False, 'mode': None, 'changed_files': [], 'users': {},
+            'error': error, 'seconds': 0, 'log': ''}
+
+
+def build_summary(results):
+    """저장소별 결과 -> 그룹 전체 요약 (입력 순서 유지, 참여자 순위 포함)"""
+    groups = []
+    leaderboard = []
+    totals = {'groups': len(results), 'failed': 0, 'participants': 0, 'problems': 0, 'fine': 0}
+    for result in results:
+        name = Path(result['root']).name
+        groups.append({key: value for key, value in result.items() if key != 'log'})
+        if not result['ok']:
+            totals['failed'] += 1
+            continue
+        for username, stats in result['users'].items():
+            totals['participants'] += 1
+            totals['problems'] += stats['problems']
+            totals['fine'] += stats['fine']
+            leaderboard.append(dict(stats, group=name, user=username))
+    leaderboard.sort(key=lambda row: (-row['problems'], -row['success_rate'], row['group'], row['user']))
+    return {
+        'version': SUMMARY_VERSION,
+        'totals': totals,
+        'leaderboard': leaderboard[:LEADERBOARD_SIZE],
+        'groups': groups,
+    }
+
+
+def read_roots(paths, roots_file):
+    """명령행 + 파일(한 줄에 하나, #은 주석)의 저장소 경로를 절대 경로로 (중복 제거)"""
+    roots = list(paths)
+    if roots_file:
+        with open(roots_file, 'r', encoding='utf-8') as f:
+            roots += [line.strip() for line in f if line.strip() and not line.lstrip().startswith('#')]
+    unique = []
+    for root in roots:
+        resolved = str(Path(root).resolve())
+        if resolved not in unique:
+            unique.append(resolved)
+    return unique
+
+
+def parse_args():
+    argv = sys.argv[1:]
+    passthrough = []
+    if '--' in argv:
+        split = argv.index('--')
+        argv, passthrough = argv[:split], argv[split + 1:]
+    parser = argparse.ArgumentParser(
+        description='여러 스터디 저장소의 README를 병렬로 갱신',
+        epilog='-- 뒤의 옵션은 각 저장소의 update_readme.py에 그대로 전달됩니다.'
+    )
+    parser.add_argument('roots', nargs='*', help='저장소 루트 경로')
+    parser.add_argument('--roots-file', metavar='PATH', help='저장소 경로 목록 파일 (한 줄에 하나)')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help='동시에 처리할 저장소 수')
+    parser.add_argument('--summary', metavar='PATH', help='그룹 전체 요약 JSON 저장 경로 (- 이면 표준 출력, 진행 로그는 생략)')
+    parser.add_argument('-q', '--quiet', action='store_true', help='실패한 저장소의 로그만 출력')
+    args = parser.parse_args(argv)
+    args.roots = read_roots(args.roots, args.roots_file)
+    if not args.roots:
+        parser.error('저장소 경로를 하나 이상 지정해야 함')
+    if args.jobs < 1:
+        parser.error('--jobs는 1 이상이어야 함')
+
+    # 저장소마다 같은 옵션을 쓰므로 전달할 옵션은 미리 한 번 검사
+    import update_readme
+    args.passthrough = DEFAULT_ARGS + passthrough
+    options = update_readme.parse_args(args.passthrough)
+    unsupported = [name for name in UNSUPPORTED_OPTIONS if getattr(options, name)]
+    if unsupported:
+        parser.error(f"일괄 실행에서 쓸 수 없는 옵션: {', '.join('--' + name.replace('_', '-') for name in unsupported)}")
+    return args
+
+
+def main():
+    args = parse_args()
+    # 요약 JSON을 표준 출력으로 내보낼 때는 진행 로그를 섞지 않음 (실패 로그는 stderr)
+    if args.quiet or args.summary == '-':
+        log.level = QUIET
+
+    started = time.perf_counter()
+    jobs = min(args.jobs, len(args.roots))
+    log.info(f"📦 저장소 {len(args.roots)}개 갱신 시작 (동시 {jobs}개)")
+    results = {}
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(update_repo, root, args.passthrough): root for root in args.roots}
+        for future in as_completed(futures):
+            root = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # 작업 프로세스가 비정상 종료한 경우 (메모리 부족 등)
+                result = failed_result(root, f"{type(e).__name__}: {e}")
+            results[root] = result
+            if result['ok']:
+                log.info(f"\n✅ {root} ({result['mode']}, {result['seconds']:.2f}초, 변경 {len(result['changed_files'])}개)")
+                if result['log']:
+                    log.info(result['log'].rstrip('\n'))
+            else:
+                log.error(f"\n❌ {root}: {result['error']}")
+                if result['log']:
+                    log.error(result['log'].rstrip('\n'))
+
+    summary = build_summary([results[root] for root in args.roots])
+    summary['total_seconds'] = round(time.perf_counter() - started, 3)
+    if args.summary:
+        text = json.dumps(summary, ensure_ascii=False, indent=2) + '\n'
+        if args.summary == '-':
+            sys.stdout.write(text)
+        else:
+            with open(args.summary, 'w', encoding='utf-8') as f:
+                f.write(text)
+
+    totals = summary['totals']
+    log.info(f"\n📊 저장소 {totals['groups']}개 (실패 {totals['failed']}개), 참여자 {totals['participants']}명, "
+             f"문제 {totals['problems']}개, {summary['total_seconds']:.2f}초")
+    if totals['failed']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
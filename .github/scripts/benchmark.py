@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""README 파이프라인 벤치마크 - 임시 Git 저장소를 만들어 단계별 시간을 JSON으로 출력
+
+사용 예:
+    python .github/scripts/benchmark.py --users 50 --days 730 --output bench.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(SCRIPT_DIR))
+
+BENCHMARK_VERSION = 2
+KST_OFFSET = timezone(timedelta(hours=9))
+# 가상 스터디의 마지막 날 (같은 시드면 실행하는 날짜와 무관하게 같은 저장소 / 같은 통계)
+DEFAULT_END_DATE = date(2025, 6, 30)
+
+# 전체 실행도 종료일 기준 시각으로 고정해서 측정 (argv: 스크립트 폴더, 기준 시각, update_readme 옵션...)
+END_TO_END_SCRIPT = (
+    "import sys; from datetime import datetime; sys.path.insert(0, sys.argv[1]); import update_readme; "
+    "args = update_readme.parse_args(sys.argv[3:]); update_readme.prepare_run(args); "
+    "update_readme.set_run_clock(datetime.fromisoformat(sys.argv[2])); update_readme.run(args)"
+)
+
+ROOT_README = """# 📚 Together with Baekjoon
+
+벤치마크용 저장소
+
+---
+
+## 👥 참여자
+"""
+
+PROBLEM_README = """[#{number}. 문제 {number}](https://www.acmicpc.net/problem/{number})
+<img src="https://static.solved.ac/tier_small/{tier}.svg" width="16" height="16">
+
+---
+
+## 📍 문제 정보
+
+- **문제 번호**: {number}
+- **🏷️ 문제 유형**: {category}
+
+---
+
+## 📊 풀이 정보
+
+- **⏱️ 소요 시간**: {minutes}분
+- **🔄 시도 횟수**: {attempts}회
+- **📅 풀이 날짜**: {day}
+
+---
+
+## 💭 풀이 과정 (ETC)
+
+> {notes}
+"""
+
+CATEGORIES = ('구현', '다이나믹 프로그래밍', '그래프 탐색', '정렬', '수학', '문자열', '그리디')
+
+
+def solve_events(users, days, solve_rate, seed, end_date=DEFAULT_END_DATE):
+    """(커밋 시각, 사용자, 문제 번호, 티어) 목록 - end_date 전 days일 동안, 오전 4시 전후에 몰리도록 생성"""
+    rng = random.Random(seed)
+    start = end_date - timedelta(days=days)
+    events = []
+    for user_index in range(users):
+        username = f"user{user_index:03d}"
+        numbers = rng.sample(range(1000, 35000), k=min(days * 2, 34000))
+        solved = 0
+        for offset in range(days):
+            day = start + timedelta(days=offset)
+            if day.weekday() >= 5 or rng.random() >= solve_rate:
+                continue
+            # 절반은 마감(오전 4시) 직전/직후, 나머지는 저녁 시간
+            if rng.random() < 0.5:
+                minutes = 24 * 60 + 4 * 60 + rng.randint(-90, 30)
+            else:
+                minutes = rng.randint(19 * 60, 23 * 60 + 59)
+            committed = datetime(day.year, day.month, day.day, tzinfo=KST_OFFSET) + timedelta(minutes=minutes)
+            events.append((committed, username, numbers[solved], rng.randint(1, 20)))
+            solved += 1
+    events.sort()
+    return events
+
+
+def fast_import_stream(events, seed):
+    """git fast-import 입력 생성 (사용자 풀이 1건 = 커밋 1개)"""
+    rng = random.Random(seed)
+    chunks = []
+
+    def data(payload):
+        raw = payload.encode('utf-8')
+        chunks.append(b'data %d\n' % len(raw))
+        chunks.append(raw + b'\n')
+
+    first = events[0][0] if events else datetime.now(KST_OFFSET)
+    chunks.append(b'commit refs/heads/main\n')
+    stamp = int(first.timestamp()) - 86400
+    chunks.append(b'committer bench <bench@example.com> %d +0900\n' % stamp)
+    data('init')
+    chunks.append(b'M 100644 inline README.md\n')
+    data(ROOT_README)
+
+    for committed, username, number, tier in events:
+        stamp = int(committed.timestamp())
+        chunks.append(b'commit refs/heads/main\n')
+        chunks.append(f'author {username} <{username}@example.com> {stamp} +0900\n'.encode('utf-8'))
+        chunks.append(f'committer {username} <{username}@example.com> {stamp} +0900\n'.encode('utf-8'))
+        data(f'solve: 백준 {number}')
+        readme = PROBLEM_README.format(
+            number=number, tier=tier, category=rng.choice(CATEGORIES),
+            minutes=rng.randint(5, 90), attempts=rng.randint(1, 5),
+            day=committed.date().isoformat(), notes='풀이 메모 ' * rng.randint(5, 60),
+        )
+        chunks.append(f'M 100644 inline {username}/{number}/README.md\n'.encode('utf-8'))
+        data(readme)
+        chunks.append(f'M 100644 inline {username}/{number}/main.py\n'.encode('utf-8'))
+        data('print(sum(map(int, input().split())))\n')
+    return b''.join(chunks)
+
+
+def create_repository(path, users, days, solve_rate, seed, end_date=DEFAULT_END_DATE):
+    """임시 저장소 생성 후 (커밋 수, 문제 수) 반환"""
+    events = solve_events(users, days, solve_rate, seed, end_date)
+    subprocess.run(['git', 'init', '-q', str(path)], check=True)
+    subprocess.run(['git', 'fast-import', '--quiet'], cwd=path, check=True,
+                   input=fast_import_stream(events, seed))
+    subprocess.run(['git', 'checkout', '-q', '-f', 'main'], cwd=path, check=True)
+    return len(events) + 1, len(events)
+
+
+def run_clock(end_date):
+    """측정할 때 쓸 현재 시각 - 종료일 정오 (한국 시간)"""
+    return datetime(end_date.year, end_date.month, end_date.day, 12)
+
+
+def restore_repository(repo):
+    """생성된 README / 상태 파일을 지우고 커밋된 상태로 되돌림 (매번 처음 실행처럼 파일을 새로 씀)"""
+    subprocess.run(['git', 'reset', '-q', '--hard'], cwd=repo, check=True)
+    subprocess.run(['git', 'clean', '-q', '-f', '-d', '-x'], cwd=repo, check=True)
+
+
+def timed(phases, name, func, *args, **kwargs):
+    """함수 실행 시간을 phases[name]에 기록하고 결과 반환"""
+    started = time.perf_counter()
+    result = func(*args, **kwargs)
+    phases[name] = round(time.perf_counter() - started, 6)
+    return result
+
+
+def run_phases(repo, workers, sharded=False, end_date=DEFAULT_END_DATE):
+    """update_readme의 각 단계를 저장소 안에서 실행하며 시간 측정 (기준 시각은 종료일 정오)"""
+    phases = {}
+    clock = run_clock(end_date)
+    restore_repository(repo)
+    previous = os.getcwd()
+    os.chdir(repo)
+    try:
+        # 스크립트의 진행 로그는 버리고 결과 JSON만 출력
+        with contextlib.redirect_stdout(io.StringIO()):
+            import update_readme
+            from git_history import GitHistoryIndex
+            from run_metrics import metrics
+            from study_calendar import StudyCalendar
+
+            metrics.reset()
+            update_readme.set_run_clock(clock)
+            # 이전 반복에서 변환해 둔 커밋 날짜를 쓰지 않도록 비움
+            update_readme._commit_dates.clear()
+            calendar = StudyCalendar()
+            history = timed(phases, 'git_date_resolution', GitHistoryIndex.build, '.')
+            users_data = timed(phases, 'scan', update_readme.scan_user_folders, history, workers)
+            timed(phases, 'stats', lambda: [
+                update_readme.calculate_missing_weekdays(data, calendar)
+                for data in users_data.values()
+            ])
+            timed(phases, 'render_users', lambda: [
+                update_readme.update_user_readme(username, data, calendar, sharded)
+                for username, data in users_data.items()
+            ])
+            timed(phases, 'render_main', update_readme.update_main_readme, users_data, calendar)
+            counters = dict(metrics.counters)
+    finally:
+        os.chdir(previous)
+
+    command = [sys.executable, '-c', END_TO_END_SCRIPT, str(SCRIPT_DIR), clock.isoformat(),
+               '--full', '--workers', str(workers), '--quiet']
+    if sharded:
+        command.append('--sharded')
+    restore_repository(repo)
+    started = time.perf_counter()
+    subprocess.run(command, cwd=repo, check=True, stdout=subprocess.DEVNULL)
+    phases['end_to_end'] = round(time.perf_counter() - started, 6)
+    return phases, counters
+
+
+def parse_args():
+    """명령행 옵션 파싱"""
+    parser = argparse.ArgumentParser(description='가상 스터디 저장소로 README 생성 파이프라인 벤치마크')
+    parser.add_argument('--users', type=int, default=10, help='참여자 수')
+    parser.add_argument('--days', type=int, default=180, help='스터디 기간 (일)')
+    parser.add_argument('--solve-rate', type=float, default=0.8, help='평일에 문제를 풀 확률')
+    parser.add_argument('--seed', type=int, default=42, help='난수 시드')
+    parser.add_argument('--end-date', type=date.fromisoformat, default=DEFAULT_END_DATE, metavar='YYYY-MM-DD',
+                        help='가상 스터디의 마지막 날 (측정 기준 시각도 이 날 정오로 고정)')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수 (단계별 최솟값 기록)')
+    parser.add_argument('--workers', type=int, default=min(8, os.cpu_count() or 1), help='스캔 스레드 수')
+    parser.add_argument('--output', help='결과 JSON 경로 (없으면 표준 출력)')
+    parser.add_argument('--sharded', action='store_true', help='월별 보관 파일 모드(--sharded)로 측정')
+    parser.add_argument('--keep', metavar='DIR', help='생성한 저장소를 이 경로에 남김')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    with tempfile.TemporaryDirectory(prefix='readme-bench-') as tmp:
+        repo = Path(args.keep) if args.keep else Path(tmp) / 'repo'
+        started = time.perf_counter()
+        commits, problems = create_repository(repo, args.users, args.days, args.solve_rate, args.seed,
+                                              args.end_date)
+        setup_seconds = round(time.perf_counter() - started, 6)
+
+        results = [run_phases(repo, args.workers, args.sharded, args.end_date) for _ in range(max(1, args.repeat))]
+        runs = [phases for phases, _ in results]
+
+    result = {
+        'version': BENCHMARK_VERSION,
+        'config': {
+            'users': args.users, 'days': args.days, 'solve_rate': args.solve_rate,
+            'seed': args.seed, 'end_date': args.end_date.isoformat(), 'repeat': args.repeat, 'workers': args.workers, 'sharded': args.sharded,
+        },
+        'repository': {'commits': commits, 'problems': problems, 'setup_seconds': setup_seconds},
+        'phases': {name: min(run[name] for run in runs) for name in runs[0]},
+        'counters': results[0][1],
+        'runs': runs,
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'git': subprocess.run(['git', '--version'], capture_output=True, text=True).stdout.strip(),
+        },
+    }
+    output = json.dumps(result, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
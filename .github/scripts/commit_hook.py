@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""pre-commit 훅 지원 - 스테이징된 경로 / 커밋하는 참여자 폴더 찾기, 훅 설치
+
+설치:
+    python .github/scripts/update_readme.py --install-hook
+"""
+import os
+import stat
+import threading
+from pathlib import Path
+
+from problem_parser import parse_problem_readme
+from readme_state import CatFile, problem_key, run_git
+from run_metrics import log, metrics
+
+MAPPING_PATH = Path('.github') / 'user-mapping.yml'
+HOOK_MARKER = '# together-with-baekjun: update_readme.py --hook'
+HOOK_SCRIPT = f"""#!/bin/sh
+{HOOK_MARKER}
+# 커밋하는 참여자의 README와 메인 README를 갱신해서 같은 커밋에 포함
+python3 .github/scripts/update_readme.py --hook --quiet || true
+"""
+
+
+def staged_changes(repo_root='.'):
+    """스테이징된 변경 {경로: 상태 글자(A/M/D/...)} (git 없으면 None)"""
+    output = run_git(['diff', '--cached', '--name-status', '--no-renames'], repo_root)
+    if output is None:
+        return None
+    changes = {}
+    for line in output.splitlines():
+        status, _, path = line.partition('\t')
+        if path:
+            changes[path] = status[:1]
+    return changes
+
+
+class StagedTree:
+    """커밋될 내용(인덱스) 기준으로 문제 README를 읽음
+
+    추적되지 않은 폴더나 스테이징하지 않은 수정은 커밋에 들어가지 않으므로 보지 않는다.
+    """
+
+    def __init__(self, readmes, user_folders, repo_root='.'):
+        self.readmes = readmes              # '<user>/<num>/README.md' -> 인덱스의 blob
+        self.user_folders = user_folders    # 인덱스에 파일이 하나라도 있는 최상위 폴더
+        self.repo_root = repo_root
+        self.cat_file = None
+        self.lock = threading.Lock()        # 스캔 스레드들이 cat-file 파이프 하나를 같이 씀
+
+    @classmethod
+    def load(cls, repo_root='.'):
+        """git ls-files -s로 인덱스 읽기 (git 없으면 None)"""
+        output = run_git(['ls-files', '-s'], repo_root)
+        if output is None:
+            return None
+        readmes = {}
+        user_folders = set()
+        for line in output.splitlines():
+            # '<mode> <blob> <stage>\t<path>'
+            info, _, path = line.partition('\t')
+            if '/' in path:
+                user_folders.add(path.split('/', 1)[0])
+            if problem_key(path) and path.count('/') == 2 and path.endswith('/README.md'):
+                readmes[path] = info.split()[1]
+        return cls(readmes, user_folders, repo_root)
+
+    def problem_readmes(self, user_folder):
+        """사용자 폴더의 스테이징된 문제 README 경로 목록 (경로순)"""
+        prefix = f"{Path(user_folder).as_posix()}/"
+        return [Path(path) for path in sorted(self.readmes) if path.startswith(prefix)]
+
+    def read_problem_info(self, readme_path):
+        """스테이징된 README 내용에서 문제 정보 추출 (없거나 형식이 아니면 None)"""
+        blob = self.readmes.get(Path(readme_path).as_posix())
+        if blob is None:
+            return None
+        with self.lock:
+            if self.cat_file is None:
+                self.cat_file = CatFile(self.repo_root)
+            obj = self.cat_file.read(blob)
+        metrics.count('files_read')
+        try:
+            return parse_problem_readme(obj[1]) if obj and obj[0] == 'blob' else None
+        except UnicodeDecodeError:
+            return None
+
+    def close(self):
+        if self.cat_file is not None:
+            self.cat_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def load_user_mapping(path=MAPPING_PATH):
+    """GitHub ID -> 폴더 이름 매핑 (파일이 없으면 빈 dict)"""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    metrics.count('files_read')
+    try:
+        import yaml
+        data = yaml.safe_load(text) or {}
+        return {str(key): str(value) for key, value in data.items()}
+    except ImportError:
+        # PyYAML이 없으면 'github_id: "폴더명"' 한 줄 형식만 직접 파싱
+        mapping = {}
+        for line in text.splitlines():
+            key, sep, value = line.partition(':')
+            if sep and key.strip() and not key.lstrip().startswith('#'):
+                mapping[key.strip()] = value.strip().strip('"\'')
+        return mapping
+
+
+def committer_folder(mapping, repo_root='.'):
+    """git 설정(github.user, user.name)으로 커밋하는 참여자의 폴더 찾기 (모르면 None)"""
+    lowered = {key.lower(): value for key, value in mapping.items()}
+    for key in ('github.user', 'user.name'):
+        value = (run_git(['config', key], repo_root) or '').strip()
+        if value and value.lower() in lowered:
+            return lowered[value.lower()]
+    return None
+
+
+def install_hook(repo_root='.'):
+    """.git/hooks/pre-commit 설치 (다른 훅이 이미 있으면 덮어쓰지 않음)"""
+    hooks_dir = (run_git(['rev-parse', '--git-path', 'hooks'], repo_root) or '').strip()
+    if not hooks_dir:
+        log.error("❌ git 저장소가 아님, 훅을 설치할 수 없음")
+        return False
+    hook_path = Path(repo_root) / hooks_dir / 'pre-commit'
+    if hook_path.exists() and HOOK_MARKER not in hook_path.read_text(encoding='utf-8', errors='replace'):
+        log.error(f"❌ 이미 다른 pre-commit 훅이 있음: {hook_path}")
+        return False
+    hook_path.parent.mkdir(parents=True, exist_ok=True)
+    hook_path.write_text(HOOK_SCRIPT, encoding='utf-8')
+    os.chmod(hook_path, hook_path.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    log.info(f"🪝 pre-commit 훅 설치 완료: {hook_path}")
+    return True
+
+
+def stage_files(paths, repo_root='.'):
+    """훅에서 다시 생성한 파일들을 같은 커밋에 포함되도록 스테이징"""
+    if not paths:
+        return True
+    return run_git(['add', '--'] + list(paths), repo_root) is not None
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Git 히스토리 인덱스 - 한 번의 git log 스트리밍으로 파일별 최초 커밋 시간 수집"""
+import subprocess
+from pathlib import Path
+
+from run_metrics import metrics
+
+COMMIT_MARKER = '@@commit '
+
+
+class GitHistoryIndex:
+    """경로 -> 최초 추가 커밋 시간(%ai) 맵
+
+    `git log --follow --format=%ai --reverse <path>`의 첫 줄과 같은 값을
+    문제마다 프로세스를 띄우지 않고 한 번의 히스토리 순회로 만든다.
+    (git은 --follow와 --reverse를 같이 쓰면 이름 변경을 따라가지 않으므로,
+    기존 결과와 같도록 경로가 처음 등장한 커밋 시간을 기록한다)
+    """
+
+    def __init__(self, first_commits=None, available=True, boundary_paths=None):
+        self.first_commits = first_commits if first_commits is not None else {}
+        self.available = available
+        # 얕은 클론의 경계 커밋에서 처음 보인 경로 (실제 최초 커밋은 더 과거에 있어서 알 수 없음)
+        self.boundary_paths = boundary_paths if boundary_paths is not None else set()
+
+    @classmethod
+    def build(cls, repo_root='.', paths=None, revisions=None, boundary_commits=None):
+        """git log --name-status를 한 번만 스트리밍하여 인덱스 생성
+
+        paths를 주면 해당 경로들로 제한된 히스토리만 읽는다 (증분 업데이트용).
+        revisions('<commit>..HEAD' 등)를 주면 그 범위의 커밋만 읽는다.
+        boundary_commits(얕은 클론의 경계 커밋)에서 처음 보인 경로는 시간을 기록하지 않는다.
+        """
+        if paths is not None and not paths:
+            return cls()
+        command = [
+            'git', '-c', 'core.quotePath=false', '--literal-pathspecs', 'log', '--reverse',
+            '--name-status', '--no-renames', f'--format={COMMIT_MARKER}%H %ai',
+        ]
+        if revisions:
+            command.append(revisions)
+        if paths:
+            command += ['--'] + list(paths)
+        metrics.count('git_subprocesses')
+        try:
+            process = subprocess.Popen(
+                command, cwd=repo_root, stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL, text=True, encoding='utf-8'
+            )
+        except OSError:
+            return cls(available=False)
+
+        boundary_commits = boundary_commits or ()
+        first_commits = {}
+        boundary_paths = set()
+        commit_time = None
+        at_boundary = False
+        with process.stdout:
+            for line in process.stdout:
+                line = line.rstrip('\n')
+                if not line:
+                    continue
+                if line.startswith(COMMIT_MARKER):
+                    commit_hash, _, commit_time = line[len(COMMIT_MARKER):].partition(' ')
+                    at_boundary = commit_hash in boundary_commits
+                    continue
+                fields = line.split('\t')
+                if at_boundary:
+                    # 경계 커밋은 부모가 없어서 모든 파일이 새로 추가된 것처럼 보임
+                    if len(fields) >= 2 and fields[-1] not in first_commits:
+                        boundary_paths.add(fields[-1])
+                elif len(fields) < 2 or fields[-1] not in boundary_paths:
+                    cls._apply_change(first_commits, fields, commit_time)
+
+        if process.wait() != 0:
+            # git 저장소가 아니거나 커밋이 없는 경우
+            return cls(available=False)
+        return cls(first_commits, boundary_paths=boundary_paths)
+
+    @staticmethod
+    def _apply_change(first_commits, fields, commit_time):
+        """name-status 한 줄을 인덱스에 반영 (시간순으로 호출됨)"""
+        # 'A\tpath', 'M\tpath', 'D\tpath' / 이름 변경이면 마지막 필드가 새 경로
+        if len(fields) >= 2:
+            first_commits.setdefault(fields[-1], commit_time)
+
+    def first_commit_time(self, path):
+        """경로의 최초 커밋 시간 문자열 (없으면 None)"""
+        return self.first_commits.get(str(path).replace('\\', '/'))
+
+
+def shallow_commits(repo_root='.'):
+    """얕은 클론의 경계 커밋 목록 (완전한 클론이면 빈 집합)"""
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', '--git-path', 'shallow'], cwd=repo_root,
+            capture_output=True, text=True, encoding='utf-8'
+        )
+    except OSError:
+        return set()
+    metrics.count('git_subprocesses')
+    path = Path(repo_root) / result.stdout.strip()
+    if result.returncode != 0 or not path.is_file():
+        return set()
+    with open(path, 'r', encoding='utf-8') as f:
+        return {line.strip() for line in f if line.strip()}
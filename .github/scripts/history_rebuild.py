@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""과거 시점 통계 재구성 - 작업 트리를 건드리지 않고 git 객체에서 바로 문제 README를 읽음
+
+    # 2025-08-01 (스터디 날짜, 다음 날 오전 4시 전까지의 마지막 커밋) 기준 현황
+    python .github/scripts/history_rebuild.py --at 2025-08-01
+
+    # 특정 커밋 기준
+    python .github/scripts/history_rebuild.py --at a1b2c3d
+
+    # 7월 21일부터 일주일 간격 시계열 (TSV, --json이면 스냅샷 전체)
+    python .github/scripts/history_rebuild.py --since 2025-07-21 --step 7
+
+모든 객체는 하나의 `git cat-file --batch` 프로세스로 읽고, 트리/blob 단위로 캐시하므로
+시계열에서 바뀌지 않은 사용자 폴더와 문제 README는 다시 읽거나 파싱하지 않는다.
+풀이 날짜와 통계는 update_readme.py와 같은 규칙(첫 커밋 시간, 오전 4시 기준)으로 계산한다.
+"""
+import argparse
+import json
+import subprocess
+import sys
+from datetime import date, datetime, time, timedelta, timezone
+
+from attendance import Attendance
+from git_history import GitHistoryIndex, shallow_commits
+from problem_parser import parse_problem_readme
+from readme_state import CatFile
+from run_metrics import QUIET, VERBOSE, log, metrics
+from study_calendar import StudyCalendar
+from update_readme import build_user_data, resolve_commit_date, user_stats
+
+# 스터디 하루는 다음 날 오전 4시에 끝남 (한국 시간, 서머타임 없음)
+KST_OFFSET = timezone(timedelta(hours=9))
+DAY_CUTOFF = time(4, 0)
+
+TREE_MODE = b'40000'
+
+
+def parse_tree(data):
+    """트리 객체 내용 -> [(모드, 이름, sha)] ('<mode> <name>\\0<20바이트 sha>' 반복)"""
+    entries = []
+    pos = 0
+    while pos < len(data):
+        space = data.index(b' ', pos)
+        nul = data.index(b'\0', space)
+        entries.append((data[pos:space], data[space + 1:nul].decode('utf-8', 'surrogateescape'),
+                        data[nul + 1:nul + 21].hex()))
+        pos = nul + 21
+    return entries
+
+
+def study_day_cutoff(day):
+    """스터디 날짜 day가 끝나는 시각 (다음 날 오전 4시, unix 초)"""
+    return datetime.combine(day + timedelta(days=1), DAY_CUTOFF, KST_OFFSET).timestamp()
+
+
+class Snapshot:
+    """한 커밋 시점의 사용자별 데이터 (update_readme.py의 users_data와 같은 구조)"""
+
+    __slots__ = ('commit', 'day', 'users_data')
+
+    def __init__(self, commit, day, users_data):
+        self.commit = commit
+        self.day = day                    # 통계 기준 스터디 날짜 (date)
+        self.users_data = users_data
+
+
+class HistoryRebuilder:
+    """git 객체에서 커밋 시점의 users_data를 재구성 (트리/blob 캐시는 스냅샷 사이에 공유)"""
+
+    def __init__(self, repo_root='.', revision='HEAD', calendar=None):
+        self.repo_root = repo_root
+        self.revision = revision
+        self.calendar = calendar if calendar is not None else StudyCalendar()
+        self.cat_file = CatFile(repo_root)
+        self.history = None
+        self.user_trees = {}      # 사용자 트리 sha -> [(문제 번호, README blob sha)]
+        self.problems = {}        # (문제 폴더, blob sha) -> ProblemInfo (None이면 형식 아님)
+        self.dates = {}           # 문제 폴더 -> 풀이 날짜
+
+    def close(self):
+        self.cat_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def commits(self):
+        """revision의 first-parent 커밋 목록 [(sha, 트리 sha, unix 시간, %ai)] (오래된 순)"""
+        metrics.count('git_subprocesses')
+        result = subprocess.run(
+            ['git', 'log', '--first-parent', '--reverse', '--format=%H %T %ct %ai', self.revision],
+            cwd=self.repo_root, capture_output=True, text=True, encoding='utf-8'
+        )
+        if result.returncode != 0:
+            return []
+        commits = []
+        for line in result.stdout.splitlines():
+            commit, tree, timestamp, author_time = line.split(' ', 3)
+            commits.append((commit, tree, int(timestamp), author_time))
+        return commits
+
+    def read_tree(self, sha):
+        """트리 sha -> 항목 목록 (읽을 수 없으면 빈 목록)"""
+        obj = self.cat_file.read(sha)
+        return parse_tree(obj[1]) if obj and obj[0] == 'tree' else []
+
+    def problem_readmes(self, user_tree):
+        """사용자 트리 안의 (문제 번호, README blob sha) 목록 (트리 sha로 캐시)"""
+        cached = self.user_trees.get(user_tree)
+        if cached is None:
+            cached = []
+            for mode, name, sha in self.read_tree(user_tree):
+                if mode != TREE_MODE or not name.isdigit():
+                    continue
+                for entry_mode, entry_name, blob in self.read_tree(sha):
+                    if entry_name == 'README.md' and entry_mode.startswith(b'100'):
+                        cached.append((name, blob))
+                        break
+            self.user_trees[user_tree] = cached
+        return cached
+
+    def problem_info(self, folder, blob, commit_time):
+        """문제 README blob 파싱 + 풀이 날짜 (같은 폴더의 같은 blob은 한 번만 파싱)"""
+        key = (folder, blob)
+        if key in self.problems:
+            return self.problems[key]
+        obj = self.cat_file.read(blob)
+        problem_info = parse_problem_readme(obj[1]) if obj and obj[0] == 'blob' else None
+        if problem_info is not None:
+            metrics.count('problems_scanned')
+            problem_info.folder = folder
+            problem_info.date = self.solve_date(folder, problem_info.number, commit_time)
+        self.problems[key] = problem_info
+        return problem_info
+
+    def solve_date(self, folder, number, commit_time):
+        """문제 폴더의 첫 커밋 기준 풀이 날짜 (히스토리에 없으면 스냅샷 커밋 시간 사용)"""
+        solved_on = self.dates.get(folder)
+        if solved_on is None:
+            if self.history is None:
+                boundary = shallow_commits(self.repo_root)
+                if boundary:
+                    log.warn("⚠️ 얕은 클론: 받아온 히스토리 밖에서 시작한 문제는 날짜가 늦게 잡힘 (git fetch --unshallow 권장)")
+                self.history = GitHistoryIndex.build(self.repo_root, revisions=self.revision,
+                                                     boundary_commits=boundary)
+            first_commit = self.history.first_commit_time(f"{folder}/README.md") or commit_time
+            solved_on = self.dates[folder] = resolve_commit_date(number, first_commit)
+        return solved_on
+
+    def snapshot(self, commit, tree, commit_time, day=None):
+        """커밋 트리 기준 users_data 재구성, 통계는 스터디 날짜 day 기준 (기본: 커밋 날짜)"""
+        if day is None:
+            day = date.fromisoformat(resolve_commit_date(commit[:7], commit_time))
+        users_data = {}
+        for mode, username, user_tree in self.read_tree(tree):
+            if mode != TREE_MODE or username.startswith('.'):
+                continue
+            problems = []
+            for number, blob in self.problem_readmes(user_tree):
+                problem_info = self.problem_info(f"{username}/{number}", blob, commit_time)
+                if problem_info is not None:
+                    problems.append(problem_info)
+            user_data = build_user_data(username, problems)
+            attendance = Attendance.from_ordinals(user_data.solve_days(), day, self.calendar, username)
+            user_data.stats = user_stats(user_data, attendance)
+            users_data[username] = user_data
+        return Snapshot(commit, day, users_data)
+
+    def at_commit(self, revision):
+        """커밋(해시/태그/브랜치) 시점의 스냅샷 (커밋이 없으면 None)"""
+        metrics.count('git_subprocesses')
+        result = subprocess.run(
+            ['git', 'log', '-1', '--format=%H %T %ai', revision, '--'],
+            cwd=self.repo_root, capture_output=True, text=True, encoding='utf-8'
+        )
+        if result.returncode != 0 or not result.stdout.strip():
+            return None
+        commit, tree, commit_time = result.stdout.strip().split(' ', 2)
+        return self.snapshot(commit, tree, commit_time)
+
+    def series(self, days):
+        """스터디 날짜마다 그날이 끝나기 전 마지막 커밋의 스냅샷 (첫 커밋 전 날짜는 건너뜀)
+
+        날짜는 오름차순이어야 하고, 커밋 목록을 한 번만 훑는다.
+        """
+        commits = self.commits()
+        index = -1
+        for day in days:
+            cutoff = study_day_cutoff(day)
+            while index + 1 < len(commits) and commits[index + 1][2] < cutoff:
+                index += 1
+            if index < 0:
+                continue
+            commit, tree, _, commit_time = commits[index]
+            yield self.snapshot(commit, tree, commit_time, day)
+
+    def at_date(self, day):
+        """스터디 날짜 day가 끝날 때의 스냅샷 (그 전에 커밋이 없으면 None)"""
+        return next(self.series([day]), None)
+
+
+def snapshot_rows(snapshot):
+    """스냅샷 -> 사용자별 통계 행 (풀이 수 많은 순)"""
+    rows = []
+    for username, user_data in snapshot.users_data.items():
+        stats = user_data.stats
+        rows.append({
+            'date': snapshot.day.isoformat(),
+            'commit': snapshot.commit,
+            'user': username,
+            'problems': user_data.total_count,
+            'first_date': stats['first_date'],
+            'success_days': stats['success_days'],
+            'failure_days': stats['failure_days'],
+            'success_rate': round(stats['success_rate'], 1),
+            'current_streak': stats['current_streak'],
+            'longest_streak': stats['longest_streak'],
+            'fine': stats['fine'],
+            'last_update': user_data.last_update,
+        })
+    rows.sort(key=lambda row: (-row['problems'], row['user']))
+    return rows
+
+
+def print_leaderboard(snapshot):
+    """스냅샷 한 개를 메인 README 표와 같은 열로 출력"""
+    print(f"📅 {snapshot.day} 기준 (커밋 {snapshot.commit[:7]})")
+    print(f"{'참여자':<12}{'시작일':>12}{'문제':>6}{'성공':>6}{'실패':>6}{'출석률':>8}{'연속':>6}{'최장':>6}{'벌금':>10}  최근 활동")
+    for row in snapshot_rows(snapshot):
+        print(f"{row['user']:<12}{row['first_date'] or '-':>12}{row['problems']:>6}{row['success_days']:>6}"
+              f"{row['failure_days']:>6}{row['success_rate']:>7.1f}%{row['current_streak']:>6}"
+              f"{row['longest_streak']:>6}{row['fine']:>9,}원  {row['last_update'] or '-'}")
+
+
+def date_range(since, until, step):
+    """since ~ until (양 끝 포함) step일 간격 날짜"""
+    day = since
+    while day <= until:
+        yield day
+        day += timedelta(days=step)
+
+
+def parse_day(value):
+    """'YYYY-MM-DD'면 date, 아니면 None (커밋으로 취급)"""
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='git 객체에서 과거 시점의 스터디 통계 재구성')
+    parser.add_argument('--at', metavar='DATE|COMMIT',
+                        help='이 스터디 날짜(YYYY-MM-DD)가 끝날 때 또는 이 커밋 시점의 현황 출력')
+    parser.add_argument('--since', type=date.fromisoformat, metavar='YYYY-MM-DD',
+                        help='시계열 시작 날짜 (기본: 첫 커밋 날짜)')
+    parser.add_argument('--until', type=date.fromisoformat, metavar='YYYY-MM-DD',
+                        help='시계열 끝 날짜 (기본: 마지막 커밋 날짜)')
+    parser.add_argument('--step', type=int, default=1, metavar='DAYS', help='시계열 간격 (일)')
+    parser.add_argument('--revision', default='HEAD', help='히스토리를 읽을 브랜치/커밋')
+    parser.add_argument('--json', metavar='PATH', help='결과 행을 JSON으로 저장 (- 이면 표준 출력)')
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument('-q', '--quiet', action='store_true', help='오류만 출력')
+    verbosity.add_argument('-v', '--verbose', action='store_true', help='문제별 상세 로그까지 출력')
+    args = parser.parse_args()
+    if args.step < 1:
+        parser.error('--step은 1 이상이어야 함')
+    return args
+
+
+def main():
+    args = parse_args()
+    # 표준 출력으로 표/JSON을 내보낼 때는 진행 로그를 섞지 않음 (오류는 stderr)
+    to_stdout = not args.at and (not args.json or args.json == '-')
+    if args.quiet or (to_stdout and not args.verbose):
+        log.level = QUIET
+    elif args.verbose:
+        log.level = VERBOSE
+
+    with HistoryRebuilder(revision=args.revision, calendar=StudyCalendar.load()) as rebuilder:
+        if args.at:
+            day = parse_day(args.at)
+            snapshot = rebuilder.at_date(day) if day else rebuilder.at_commit(args.at)
+            if snapshot is None:
+                log.error(f"❌ {args.at} 시점의 커밋을 찾을 수 없음")
+                sys.exit(1)
+            snapshots = [snapshot]
+        else:
+            commits = rebuilder.commits()
+            if not commits:
+                log.error(f"❌ {args.revision}의 커밋을 읽을 수 없음")
+                sys.exit(1)
+            since = args.since or date.fromisoformat(resolve_commit_date(commits[0][0][:7], commits[0][3]))
+            until = args.until or date.fromisoformat(resolve_commit_date(commits[-1][0][:7], commits[-1][3]))
+            snapshots = rebuilder.series(date_range(since, until, args.step))
+
+        rows = []
+        for snapshot in snapshots:
+            if args.at and not args.json:
+                print_leaderboard(snapshot)
+            rows += snapshot_rows(snapshot)
+
+    if args.json:
+        text = json.dumps(rows, ensure_ascii=False, indent=2) + '\n'
+        if args.json == '-':
+            sys.stdout.write(text)
+        else:
+            with open(args.json, 'w', encoding='utf-8') as f:
+                f.write(text)
+    elif not args.at:
+        columns = list(rows[0]) if rows else []
+        print('\t'.join(columns))
+        for row in rows:
+            print('\t'.join('' if row[column] is None else str(row[column]) for column in columns))
+    log.info(f"✅ 스냅샷 재구성 완료: 행 {len(rows)}개, git 객체 {metrics.counters.get('git_objects_read', 0)}개 읽음")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+"""로컬 채점기 - 문제 폴더의 풀이들을 빌드하고 예제 입력으로 병렬 실행해서 시간/메모리 측정
+
+사용 예:
+    python .github/scripts/judge.py                          # 모든 문제 폴더
+    python .github/scripts/judge.py junho/2293 --input big.txt --format markdown
+
+예제는 폴더 안의 입출력 파일(`*.in`/`*.out`, `input*.txt`/`output*.txt`)과
+문제 README의 '예제 입력/예제 출력', '**입력 예시**/**출력 예시**' 부분에서 찾는다.
+컴파일 결과는 `.judge-cache/<소스 해시>/`에 저장해서 소스가 같으면 다시 빌드하지 않는다.
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:
+    # Windows 등: 자원 제한 / 메모리 측정 없이 실행
+    resource = None
+
+from run_metrics import QUIET, VERBOSE, log
+
+JUDGE_VERSION = 1
+CACHE_DIR = Path('.judge-cache')
+DEFAULT_TIME_LIMIT = 2.0      # 초 (CPU 시간)
+DEFAULT_MEMORY_LIMIT = 256    # MB
+OUTPUT_LIMIT = 16 * 1024 * 1024
+
+# 확장자 -> (언어, 컴파일 명령, 실행 명령)
+# {src}: 소스 경로, {out}: 캐시 디렉터리 안의 실행 파일, {dir}: 캐시 디렉터리, {main}: 자바 메인 클래스
+LANGUAGES = {
+    '.py': ('python', None, [sys.executable, '{src}']),
+    '.py3': ('python', None, [sys.executable, '{src}']),
+    '.c': ('c', ['gcc', '-O2', '-std=gnu11', '-o', '{out}', '{src}', '-lm'], ['{out}']),
+    '.cpp': ('cpp', ['g++', '-O2', '-std=gnu++17', '-o', '{out}', '{src}'], ['{out}']),
+    '.cc': ('cpp', ['g++', '-O2', '-std=gnu++17', '-o', '{out}', '{src}'], ['{out}']),
+    '.rs': ('rust', ['rustc', '-O', '--edition', '2021', '-o', '{out}', '{src}'], ['{out}']),
+    '.java': ('java', ['javac', '-encoding', 'UTF-8', '-d', '{dir}', '{src}'],
+              ['java', '-Xss64m', '-Xmx{memory}m', '-cp', '{dir}', '{main}']),
+    '.js': ('javascript', None, ['node', '--max-old-space-size={memory}', '{src}']),
+}
+# 시작할 때 큰 가상 메모리를 예약하는 런타임 - RLIMIT_AS 대신 실행 옵션(-Xmx 등)으로 힙을 제한
+SELF_LIMITED_LANGUAGES = ('java', 'javascript')
+
+SAMPLE_OUTPUT_SUFFIXES = ('.out', '.ans')
+SAMPLE_HEADING_RE = re.compile(r'^#+\s*.*예제\s*(입력|출력)\s*(\d*)')
+SAMPLE_LABEL_RE = re.compile(r'^\*\*\s*(입력|출력)\s*예시\s*(\d*)\s*\*\*\s*$')
+# 메모리 제한(RLIMIT_AS)에 걸려 할당에 실패했을 때 언어별 메시지
+OUT_OF_MEMORY_MARKERS = ('MemoryError', 'bad_alloc', 'OutOfMemoryError', 'memory allocation', 'heap out of memory')
+JAVA_CLASS_RE = re.compile(r'\bclass\s+(\w+)')
+JAVA_MAIN_RE = re.compile(r'\bstatic\s+void\s+main\s*\(')
+
+
+class Solution:
+    """문제 폴더 안의 풀이 파일 하나"""
+
+    __slots__ = ('folder', 'path', 'language', 'key')
+
+    def __init__(self, folder, path, language, key):
+        self.folder = folder
+        self.path = path
+        self.language = language
+        self.key = key  # 컴파일 캐시 키 (소스 + 컴파일 명령 해시)
+
+
+def find_problem_folders(targets):
+    """인자로 받은 경로들에서 문제 폴더 찾기 (없으면 모든 <사용자>/<번호> 폴더)"""
+    if not targets:
+        targets = [p for p in sorted(Path('.').iterdir()) if p.is_dir() and not p.name.startswith('.')]
+    folders = []
+    for target in map(Path, targets):
+        if target.is_dir() and target.name.isdigit():
+            folders.append(target)
+        elif target.is_dir():
+            folders.extend(sorted(p for p in target.iterdir() if p.is_dir() and p.name.isdigit()))
+    return folders
+
+
+def source_key(language, compile_command, data):
+    """컴파일 캐시 키 - 같은 소스와 같은 컴파일 명령이면 같은 값"""
+    digest = hashlib.sha256()
+    digest.update(language.encode('utf-8') + b'\0')
+    digest.update(' '.join(compile_command or []).encode('utf-8') + b'\0')
+    digest.update(data)
+    return digest.hexdigest()[:24]
+
+
+def find_solutions(folder):
+    """폴더 안의 풀이 파일 목록 (파일 이름순)"""
+    solutions = []
+    for path in sorted(folder.iterdir()):
+        spec = LANGUAGES.get(path.suffix.lower())
+        if not path.is_file() or spec is None:
+            continue
+        language, compile_command, _ = spec
+        key = source_key(language, compile_command, path.read_bytes())
+        solutions.append(Solution(folder.as_posix(), path, language, key))
+    return solutions
+
+
+def _strip_block(lines):
+    """예제 본문 정리 - 코드 블록이면 안쪽만, 인용(>)이면 표시 제거, 앞뒤 빈 줄 제거"""
+    fenced = [i for i, line in enumerate(lines) if line.strip().startswith('```')]
+    if len(fenced) >= 2:
+        lines = lines[fenced[0] + 1:fenced[1]]
+    else:
+        lines = [re.sub(r'^\s*>\s?', '', line) for line in lines]
+        lines = [re.sub(r'\s*<br\s*/?>\s*$', '', line) for line in lines]
+    while lines and not lines[0].strip():
+        lines.pop(0)
+    while lines and not lines[-1].strip():
+        lines.pop()
+    return '\n'.join(lines) + '\n' if lines else ''
+
+
+def parse_readme_samples(text):
+    """문제 README에서 (입력, 출력) 예제 목록 추출"""
+    blocks = {'입력': [], '출력': []}
+    current = None
+    for line in text.splitlines():
+        heading = SAMPLE_HEADING_RE.match(line) or SAMPLE_LABEL_RE.match(line.strip())
+        if heading:
+            current = []
+            blocks[heading.group(1)].append(current)
+            continue
+        if current is not None and (line.startswith('#') or line.strip() == '---'
+                                    or (line.startswith('**') and line.rstrip().endswith('**'))):
+            current = None
+        if current is not None:
+            current.append(line)
+    inputs = [_strip_block(lines) for lines in blocks['입력']]
+    outputs = [_strip_block(lines) for lines in blocks['출력']]
+    return [(data, expected) for data, expected in zip(inputs, outputs) if data or expected]
+
+
+def find_samples(folder, extra_inputs=()):
+    """폴더의 예제 목록 [(이름, 입력, 기대 출력 또는 None)]"""
+    samples = []
+    for path in sorted(folder.iterdir()):
+        if path.suffix == '.in':
+            for output_suffix in SAMPLE_OUTPUT_SUFFIXES:
+                expected = path.with_suffix(output_suffix)
+                if expected.exists():
+                    samples.append((path.name, path.read_text(encoding='utf-8'), expected.read_text(encoding='utf-8')))
+                    break
+            else:
+                samples.append((path.name, path.read_text(encoding='utf-8'), None))
+        elif path.name.startswith('input') and path.suffix == '.txt':
+            expected = folder / ('output' + path.name[len('input'):])
+            output = expected.read_text(encoding='utf-8') if expected.exists() else None
+            samples.append((path.name, path.read_text(encoding='utf-8'), output))
+
+    readme = folder / 'README.md'
+    if readme.exists():
+        readme_samples = parse_readme_samples(readme.read_text(encoding='utf-8', errors='replace'))
+        for index, (data, expected) in enumerate(readme_samples, 1):
+            samples.append((f"README-{index}", data, expected))
+
+    for path in extra_inputs:
+        samples.append((Path(path).name, Path(path).read_text(encoding='utf-8'), None))
+    return samples
+
+
+def java_main_class(source):
+    """main 메서드가 있는 자바 클래스 이름 (main 바로 앞에 선언된 클래스, 못 찾으면 Main)"""
+    main = JAVA_MAIN_RE.search(source)
+    classes = JAVA_CLASS_RE.findall(source[:main.start()] if main else source)
+    return classes[-1] if classes else 'Main'
+
+
+def _format(command, **values):
+    return [part.format(**values) for part in command]
+
+
+def compile_solution(task):
+    """풀이 하나를 캐시 디렉터리에 빌드 (프로세스 풀에서 실행), (키, 성공 여부, 메시지) 반환"""
+    key, source_path, suffix, cache_dir = task
+    language, compile_command, _ = LANGUAGES[suffix]
+    target_dir = Path(cache_dir) / key
+    if compile_command is None or (target_dir / 'ok').exists():
+        return key, True, 'cached' if compile_command else ''
+    if shutil.which(compile_command[0]) is None:
+        return key, False, f"{compile_command[0]} 없음"
+
+    # 다른 프로세스와 겹치지 않도록 임시 디렉터리에서 빌드 후 이름 변경
+    work_dir = Path(tempfile.mkdtemp(prefix=f".{key}.", dir=cache_dir))
+    source = Path(source_path).read_text(encoding='utf-8', errors='replace')
+    if language == 'java':
+        # public 클래스는 파일 이름이 클래스 이름과 같아야 함
+        src = work_dir / f"{java_main_class(source)}.java"
+    else:
+        src = work_dir / f"main{suffix}"
+    src.write_text(source, encoding='utf-8')
+    command = _format(compile_command, src=src, out=work_dir / 'main', dir=work_dir)
+    result = subprocess.run(command, capture_output=True, text=True, errors='replace')
+    if result.returncode != 0:
+        shutil.rmtree(work_dir, ignore_errors=True)
+        return key, False, result.stderr.strip()[-2000:]
+
+    (work_dir / 'ok').write_text(java_main_class(source) if language == 'java' else '', encoding='utf-8')
+    try:
+        os.replace(work_dir, target_dir)
+    except OSError:
+        # 같은 키를 다른 프로세스가 먼저 만든 경우
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return key, True, 'compiled'
+
+
+def _limit_resources(time_limit, memory_limit, limit_memory):
+    """자식 프로세스에서 exec 직전에 CPU 시간 / 메모리 제한 설정"""
+    def apply():
+        seconds = max(1, int(time_limit + 0.999))
+        resource.setrlimit(resource.RLIMIT_CPU, (seconds, seconds + 1))
+        if limit_memory:
+            limit = memory_limit * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    return apply
+
+
+def normalize_output(text):
+    """채점용 출력 정규화 - 줄 끝 공백과 마지막 빈 줄 무시"""
+    return [line.rstrip() for line in text.rstrip().splitlines()]
+
+
+# 리눅스는 exec 전 (fork된 파이썬 워커의) 최대 RSS를 자식의 ru_maxrss에 이어서 기록하므로
+# 워커마다 빈 프로세스를 한 번 실행해서 측정 하한을 구해 두고, 그 이하는 하한으로만 표시
+_memory_floor_kb = None
+
+
+def memory_floor_kb():
+    """이 워커에서 실행한 자식 프로세스의 ru_maxrss 하한 (KB)"""
+    global _memory_floor_kb
+    if _memory_floor_kb is None:
+        process = subprocess.Popen(['true'])
+        _, _, usage = os.wait4(process.pid, 0)
+        process.returncode = 0
+        _memory_floor_kb = usage.ru_maxrss // 1024 if sys.platform == 'darwin' else usage.ru_maxrss
+    return _memory_floor_kb
+
+
+def run_case(task):
+    """예제 하나 실행 (프로세스 풀에서 실행) - 판정, 시간, 최대 메모리 반환"""
+    suffix, source_path, key, cache_dir, data, expected, time_limit, memory_limit = task
+    language, _, run_command = LANGUAGES[suffix]
+    target_dir = Path(cache_dir) / key
+    main_class = ''
+    if language == 'java':
+        main_class = (target_dir / 'ok').read_text(encoding='utf-8')
+    command = _format(run_command, src=Path(source_path).resolve(), out=target_dir / 'main',
+                      dir=target_dir, main=main_class, memory=memory_limit)
+    if shutil.which(command[0]) is None and not Path(command[0]).exists():
+        return {'verdict': 'SKIP', 'message': f"{command[0]} 없음"}
+
+    with tempfile.TemporaryFile() as stdin_file, tempfile.TemporaryFile() as stdout_file, \
+            tempfile.TemporaryFile() as stderr_file:
+        stdin_file.write(data.encode('utf-8'))
+        stdin_file.seek(0)
+        limit_memory = language not in SELF_LIMITED_LANGUAGES
+        preexec = _limit_resources(time_limit, memory_limit, limit_memory) if resource else None
+        started = time.perf_counter()
+        process = subprocess.Popen(command, stdin=stdin_file, stdout=stdout_file, stderr=stderr_file,
+                                   cwd=Path(source_path).parent, preexec_fn=preexec)
+        # 입력을 기다리며 멈춘 경우처럼 CPU를 쓰지 않는 경우를 대비한 실제 시간 제한
+        timer = threading.Timer(time_limit * 3 + 1, process.kill)
+        timer.start()
+        try:
+            if hasattr(os, 'wait4'):
+                _, status, usage = os.wait4(process.pid, 0)
+                process.returncode = os.waitstatus_to_exitcode(status)
+            else:
+                process.wait()
+                usage = None
+        finally:
+            timer.cancel()
+        elapsed = time.perf_counter() - started
+
+        stdout_file.seek(0)
+        output = stdout_file.read(OUTPUT_LIMIT).decode('utf-8', errors='replace')
+        stderr_file.seek(0)
+        errors = stderr_file.read(4000).decode('utf-8', errors='replace')
+
+    cpu_time = usage.ru_utime + usage.ru_stime if usage else elapsed
+    # 리눅스의 ru_maxrss는 KB 단위 (macOS는 바이트)
+    memory_kb = (usage.ru_maxrss // 1024 if sys.platform == 'darwin' else usage.ru_maxrss) if usage else None
+    floor_kb = memory_floor_kb() if usage else None
+    result = {
+        'time_ms': round(elapsed * 1000, 1),
+        'cpu_ms': round(cpu_time * 1000, 1),
+        # 하한 이하이면 실제 사용량은 floor 이하라는 것만 알 수 있음
+        'memory_kb': memory_kb if memory_kb and memory_kb > floor_kb else None,
+        'memory_floor_kb': floor_kb,
+        'output_sha1': hashlib.sha1(output.encode('utf-8')).hexdigest()[:12],
+        'message': '',
+    }
+    killed_by = -process.returncode if process.returncode < 0 else None
+    if cpu_time > time_limit or killed_by in (signal.SIGXCPU, signal.SIGKILL):
+        result['verdict'] = 'TLE'
+    elif (memory_kb and memory_kb >= memory_limit * 1024 * 0.95) or (
+            process.returncode != 0 and any(marker in errors for marker in OUT_OF_MEMORY_MARKERS)):
+        result['verdict'] = 'MLE'
+    elif process.returncode != 0:
+        result['verdict'] = 'RE'
+        result['message'] = errors.strip()[-500:]
+    elif expected is None:
+        result['verdict'] = 'OK'  # 기대 출력이 없으면 정상 종료만 확인
+    elif normalize_output(output) == normalize_output(expected):
+        result['verdict'] = 'AC'
+    else:
+        result['verdict'] = 'WA'
+    return result
+
+
+def judge(folders, workers, time_limit, memory_limit, extra_inputs=(), cache_dir=CACHE_DIR):
+    """폴더들의 모든 풀이를 빌드 / 실행하고 결과 목록 반환"""
+    # 풀이는 자기 폴더에서 실행하므로 캐시 경로는 절대 경로로 넘김
+    cache_dir = Path(cache_dir).resolve()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    solutions = [solution for folder in folders for solution in find_solutions(folder)]
+    samples = {folder.as_posix(): find_samples(folder, extra_inputs) for folder in folders}
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # 1) 같은 키는 한 번만 빌드
+        compile_tasks = {}
+        for solution in solutions:
+            compile_tasks.setdefault(solution.key, (solution.key, str(solution.path), solution.path.suffix.lower(), str(cache_dir)))
+        builds = {key: (ok, message) for key, ok, message in executor.map(compile_solution, compile_tasks.values())}
+
+        # 2) 빌드된 풀이 x 예제를 한꺼번에 실행
+        results = []
+        run_tasks = []
+        for solution in solutions:
+            ok, message = builds[solution.key]
+            base = {'folder': solution.folder, 'solution': solution.path.name, 'language': solution.language}
+            cases = samples[solution.folder]
+            if not ok:
+                verdict = 'SKIP' if message.endswith(' 없음') else 'CE'
+                results.append(dict(base, case='-', verdict=verdict, message=message))
+                continue
+            if not cases:
+                results.append(dict(base, case='-', verdict='NO_SAMPLE', message='예제 없음'))
+                continue
+            for name, data, expected in cases:
+                results.append(dict(base, case=name))
+                run_tasks.append((len(results) - 1, (solution.path.suffix.lower(), str(solution.path), solution.key,
+                                                     str(cache_dir), data, expected, time_limit, memory_limit)))
+        for (index, _), outcome in zip(run_tasks, executor.map(run_case, [task for _, task in run_tasks])):
+            results[index].update(outcome)
+    return results
+
+
+def render_markdown(results):
+    """결과를 README에 붙일 수 있는 표로 변환"""
+    lines = ["| 문제 | 풀이 | 언어 | 예제 | 결과 | 시간 | 메모리 |", "|------|------|------|------|------|------|--------|"]
+    for result in results:
+        time_text = f"{result['cpu_ms']:.0f} ms" if 'cpu_ms' in result else '-'
+        if result.get('memory_kb'):
+            memory_text = f"{result['memory_kb']:,} KB"
+        elif result.get('memory_floor_kb'):
+            memory_text = f"≤ {result['memory_floor_kb']:,} KB"
+        else:
+            memory_text = '-'
+        lines.append(f"| {result['folder']} | {result['solution']} | {result['language']} | {result['case']} "
+                     f"| {result['verdict']} | {time_text} | {memory_text} |")
+    return "\n".join(lines) + "\n"
+
+
+def parse_args():
+    """명령행 옵션 파싱"""
+    parser = argparse.ArgumentParser(description='문제 폴더의 풀이들을 예제로 실행해서 결과/시간/메모리 측정')
+    parser.add_argument('targets', nargs='*', help='문제 폴더 또는 사용자 폴더 (없으면 전체)')
+    parser.add_argument('--input', action='append', default=[], metavar='FILE',
+                        help='예제 외에 추가로 실행할 입력 파일 (여러 번 지정 가능, 큰 입력으로 풀이 비교)')
+    parser.add_argument('--time-limit', type=float, default=DEFAULT_TIME_LIMIT, metavar='SECONDS',
+                        help='예제 하나당 CPU 시간 제한')
+    parser.add_argument('--memory-limit', type=int, default=DEFAULT_MEMORY_LIMIT, metavar='MB',
+                        help='예제 하나당 메모리 제한')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='동시에 실행할 프로세스 수')
+    parser.add_argument('--cache-dir', default=str(CACHE_DIR), help='컴파일 결과 캐시 디렉터리')
+    parser.add_argument('--format', choices=('json', 'markdown'), default='json', help='출력 형식')
+    parser.add_argument('--output', metavar='PATH', help='결과를 표준 출력 대신 이 경로에 기록')
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument('-q', '--quiet', action='store_true', help='결과만 출력')
+    verbosity.add_argument('-v', '--verbose', action='store_true', help='예제별 진행 상황까지 출력')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    # 결과를 표준 출력으로 내보낼 때는 진행 로그를 섞지 않음 (오류는 stderr)
+    if args.quiet or (not args.output and not args.verbose):
+        log.level = QUIET
+    elif args.verbose:
+        log.level = VERBOSE
+
+    folders = find_problem_folders(args.targets)
+    log.info(f"⚖️ 문제 폴더 {len(folders)}개 채점 중...")
+    started = time.perf_counter()
+    results = judge(folders, args.workers, args.time_limit, args.memory_limit, args.input, args.cache_dir)
+    for result in results:
+        log.debug(f"  {result['folder']}/{result['solution']} [{result['case']}] {result['verdict']}")
+
+    if args.format == 'markdown':
+        output = render_markdown(results)
+    else:
+        output = json.dumps({
+            'version': JUDGE_VERSION,
+            'limits': {'time_seconds': args.time_limit, 'memory_mb': args.memory_limit},
+            'results': results,
+        }, ensure_ascii=False, indent=2) + '\n'
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output)
+    else:
+        sys.stdout.write(output)
+
+    verdicts = {}
+    for result in results:
+        verdicts[result['verdict']] = verdicts.get(result['verdict'], 0) + 1
+    summary = ', '.join(f"{verdict} {count}" for verdict, count in sorted(verdicts.items()))
+    log.info(f"✅ 채점 완료 ({time.perf_counter() - started:.1f}초): {summary}")
+
+
+if __name__ == '__main__':
+    main()
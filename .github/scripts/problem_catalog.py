@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""문제 카탈로그 - 모든 참여자의 풀이를 문제 번호 기준으로 합친 색인"""
+import json
+from collections import OrderedDict
+
+from problem_parser import TIER_NAMES
+from readme_writer import write_if_changed
+
+CATALOG_VERSION = 1
+# 티어 번호 -> 티어 묶음 (1~5: Bronze, 6~10: Silver, ...)
+TIER_GROUPS = ('Bronze', 'Silver', 'Gold', 'Platinum', 'Diamond', 'Ruby')
+
+
+def tier_group(tier):
+    """티어 번호의 묶음 이름 (범위 밖이면 Unknown)"""
+    if 1 <= tier <= 30:
+        return TIER_GROUPS[(tier - 1) // 5]
+    return 'Unknown'
+
+
+class CatalogEntry:
+    """문제 하나와 그 문제를 푼 참여자들"""
+
+    __slots__ = ('number', 'title', 'tier', 'solvers')
+
+    def __init__(self, number, title, tier, solvers=None):
+        self.number = number
+        self.title = title
+        self.tier = tier
+        self.solvers = solvers if solvers is not None else {}  # 사용자 -> 풀이 날짜
+
+    @property
+    def difficulty(self):
+        return TIER_NAMES[self.tier] if 1 <= self.tier <= 30 else 'Unknown'
+
+    def sorted_solvers(self):
+        """풀이 날짜순 (같은 날이면 등록 순) 참여자 목록"""
+        return sorted(self.solvers, key=lambda username: self.solvers[username])
+
+
+class ProblemCatalog:
+    """문제 번호 -> CatalogEntry (한 번 만들어 두고 O(1) 조회)"""
+
+    def __init__(self):
+        self.entries = OrderedDict()
+
+    @classmethod
+    def build(cls, users_data):
+        """이번 실행의 사용자 데이터로 카탈로그 생성 (폴더를 다시 읽지 않음)"""
+        catalog = cls()
+        for username, user_data in users_data.items():
+            for problem in user_data.problems:
+                catalog.add(username, problem)
+        return catalog
+
+    def add(self, username, problem):
+        """풀이 하나 추가 (제목/티어는 처음 등록된 풀이 기준)"""
+        entry = self.entries.get(problem.number)
+        if entry is None:
+            entry = self.entries[problem.number] = CatalogEntry(problem.number, problem.title, problem.tier)
+        previous = entry.solvers.get(username)
+        if previous is None or problem.date < previous:
+            entry.solvers[username] = problem.date
+
+    def get(self, number):
+        return self.entries.get(str(number))
+
+    def __len__(self):
+        return len(self.entries)
+
+    def most_solved(self, limit=5):
+        """푼 사람이 많은 문제 순 (같으면 문제 번호순)"""
+        ranked = sorted(self.entries.values(), key=lambda entry: (-len(entry.solvers), int(entry.number)))
+        return ranked[:limit]
+
+    def tier_distribution(self):
+        """티어 묶음별 (문제 수, 풀이 수) - Bronze부터 순서대로, 없는 묶음은 생략"""
+        distribution = OrderedDict((group, [0, 0]) for group in TIER_GROUPS + ('Unknown',))
+        for entry in self.entries.values():
+            counts = distribution[tier_group(entry.tier)]
+            counts[0] += 1
+            counts[1] += len(entry.solvers)
+        return OrderedDict((group, tuple(counts)) for group, counts in distribution.items() if counts[0])
+
+    def to_dict(self):
+        return {
+            'version': CATALOG_VERSION,
+            'problems': {
+                number: {'title': entry.title, 'tier': entry.tier, 'solvers': entry.solvers}
+                for number, entry in self.entries.items()
+            },
+        }
+
+    def save(self, path):
+        """JSON 스냅샷 저장 (내용이 바뀐 경우에만 기록)"""
+        return write_if_changed(path, json.dumps(self.to_dict(), ensure_ascii=False, indent=1) + '\n')
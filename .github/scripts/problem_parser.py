@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""문제 README 파서 - 머리 부분만 읽어서 문제 정보 레코드 생성
+
+두 가지 README 형식을 모두 인식한다.
+- junho 형식: 맨 위에 제목 링크 + 티어 이미지, '📍 문제 정보' / '📊 풀이 정보' 목록
+- hyosang 형식: '📍 문제 정보' 목록 안에 제목 링크, 문제 본문 뒤에 '📊 풀이 정보' 목록
+"""
+import os
+import re
+
+from run_metrics import metrics
+
+# solved.ac 티어 이미지 번호 -> 난이도 이름 (0: Unknown, 1: Bronze V ... 30: Ruby I)
+TIER_NAMES = (
+    'Unknown',
+    'Bronze V', 'Bronze IV', 'Bronze III', 'Bronze II', 'Bronze I',
+    'Silver V', 'Silver IV', 'Silver III', 'Silver II', 'Silver I',
+    'Gold V', 'Gold IV', 'Gold III', 'Gold II', 'Gold I',
+    'Platinum V', 'Platinum IV', 'Platinum III', 'Platinum II', 'Platinum I',
+    'Diamond V', 'Diamond IV', 'Diamond III', 'Diamond II', 'Diamond I',
+    'Ruby V', 'Ruby IV', 'Ruby III', 'Ruby II', 'Ruby I',
+)
+
+# 머리 부분(문자열)에 적용하는 정규식
+TITLE_RE = re.compile(r'\[#(\d+)\.\s*(.+?)\]')
+TIER_RE = re.compile(r'tier_small/(\d+)\.svg')
+# 굵은 글씨 라벨의 필드 줄: '- **🏷️ 문제 유형**: DP' / '- **문제 유형:** 구현' 두 형식 모두
+# ('**'로 시작하는 패턴이라 정규식 엔진이 '**' 위치만 골라서 확인함)
+FIELD_RE = re.compile(
+    r'\*\*[^*\r\n]*?(문제 유형|소요 시간|시도 횟수|풀이 날짜)[ \t]*(?:\*\*)?[ \t]*:[ \t]*(?:\*\*)?[ \t]*(\S[^\r\n]*)'
+)
+# 자유 서술(풀이 과정) 섹션 시작 - 이후로는 메타데이터가 없음 (바이트에서 찾음)
+HEADER_END_TEXT = '풀이 과정'.encode('utf-8')
+NUMBER_RE = re.compile(r'\d+')
+ISO_DATE_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+KOREAN_DATE_RE = re.compile(r'(\d{4})\s*년\s*(\d{1,2})\s*월\s*(\d{1,2})\s*일')
+
+FIELD_NAMES = {
+    '문제 유형': 'category',
+    '소요 시간': 'time_spent',
+    '시도 횟수': 'attempts',
+    '풀이 날짜': 'solved_on',
+}
+
+# 머리 부분은 read 한 번에 이만큼만 읽음 (제목/티어가 없을 때만 나머지를 읽음)
+HEADER_LIMIT_BYTES = 32 * 1024
+
+
+class ProblemInfo:
+    """문제 하나의 정보 (README 파싱 결과 + Git 기준 풀이 날짜)"""
+
+    __slots__ = ('number', 'title', 'tier', 'category', 'time_spent', 'attempts',
+                 'solved_on', 'date', 'folder')
+
+    def __init__(self, number, title, tier=0, category=None, time_spent=None, attempts=None,
+                 solved_on=None, date=None, folder=None):
+        self.number = number
+        self.title = title
+        self.tier = tier
+        self.category = category          # 문제 유형 (README 그대로)
+        self.time_spent = time_spent      # 소요 시간 (README 그대로)
+        self.attempts = attempts          # 시도 횟수 (정수)
+        self.solved_on = solved_on        # README에 적힌 풀이 날짜 (YYYY-MM-DD)
+        self.date = date                  # Git 커밋 기준 풀이 날짜 (YYYY-MM-DD)
+        self.folder = folder              # '<user>/<num>'
+
+    @property
+    def difficulty(self):
+        """티어 이름 (범위 밖이면 Unknown)"""
+        return TIER_NAMES[self.tier] if 1 <= self.tier <= 30 else 'Unknown'
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{name: data.get(name) for name in cls.__slots__ if name in data})
+
+    def __repr__(self):
+        return f"ProblemInfo({self.folder or self.number!r}, {self.title!r}, {self.difficulty}, {self.date})"
+
+
+def normalize_date(value):
+    """'2025-07-23' / '2025년 7월 21일' 형식을 'YYYY-MM-DD'로 (인식 못 하면 None)"""
+    match = ISO_DATE_RE.search(value) or KOREAN_DATE_RE.search(value)
+    if not match:
+        return None
+    if len(match.group()) == 10:
+        return match.group()  # 이미 YYYY-MM-DD
+    year, month, day = (int(part) for part in match.groups())
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+
+def find_header_end(data):
+    """'## ... 풀이 과정' 제목 줄의 시작 위치 (없으면 -1)
+
+    정규식 대신 bytes.find로 후보를 찾고 줄 머리만 확인한다.
+    """
+    pos = data.find(HEADER_END_TEXT)
+    while pos >= 0:
+        line_start = data.rfind(b'\n', 0, pos) + 1
+        if data.startswith(b'## ', line_start):
+            return line_start
+        pos = data.find(HEADER_END_TEXT, pos + 1)
+    return -1
+
+
+def header_text(data):
+    """README 바이트에서 머리 부분만 잘라서 디코딩
+
+    머리 끝을 못 찾았고 읽기 상한에서 잘린 경우에는 글자 중간에서 끊기지 않도록 마지막 줄을 버린다.
+    """
+    end = find_header_end(data)
+    if end < 0 and len(data) >= HEADER_LIMIT_BYTES:
+        end = data.rfind(b'\n') + 1
+    return (data[:end] if end >= 0 else data).decode('utf-8')
+
+
+def find_fields(header):
+    """머리 부분의 필드 줄들을 한 번에 찾아서 {필드: 첫 값}"""
+    fields = {}
+    for name, value in FIELD_RE.findall(header):
+        fields.setdefault(FIELD_NAMES[name], value)
+    return fields
+
+
+def parse_problem_readme(data, read_rest=None):
+    """README 바이트(최소한 머리 부분)에서 문제 정보 파싱, 형식이 아니면 None
+
+    제목/티어가 머리 부분에 없을 때만 read_rest()로 나머지를 읽으므로
+    결과는 파일 전체에 정규식을 적용한 것과 같다.
+    """
+    header = header_text(data)
+    title_match = TITLE_RE.search(header)
+    tier_match = TIER_RE.search(header)
+    if not title_match or not tier_match:
+        # 드물게 제목/티어가 뒤쪽에 있는 경우만 전체를 검색
+        if read_rest is not None:
+            data += read_rest()
+        text = data.decode('utf-8')
+        title_match = title_match or TITLE_RE.search(text)
+        tier_match = tier_match or TIER_RE.search(text)
+    if not title_match:
+        return None
+
+    fields = find_fields(header)
+    attempts = fields.get('attempts')
+    if attempts is not None:
+        number_match = NUMBER_RE.search(attempts)
+        attempts = int(number_match.group()) if number_match else None
+    solved_on = fields.get('solved_on')
+    category = fields.get('category')
+    time_spent = fields.get('time_spent')
+
+    return ProblemInfo(
+        number=title_match.group(1),
+        title=title_match.group(2),
+        tier=int(tier_match.group(1)) if tier_match else 0,
+        category=category.rstrip(' \t') if category else None,
+        time_spent=time_spent.rstrip(' \t') if time_spent else None,
+        attempts=attempts,
+        solved_on=normalize_date(solved_on) if solved_on else None,
+    )
+
+
+def _read_all(fd):
+    """파일 끝까지 남은 바이트"""
+    chunks = []
+    while True:
+        chunk = os.read(fd, 64 * 1024)
+        if not chunk:
+            return b''.join(chunks)
+        chunks.append(chunk)
+
+
+def read_problem_info(readme_path):
+    """문제 README 파일에서 정보 추출 (읽을 수 없거나 형식이 아니면 None)"""
+    try:
+        # 파일 객체 없이 read 한 번으로 머리 부분을 읽음 (대부분의 README는 통째로 들어옴)
+        fd = os.open(readme_path, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        metrics.count('files_read')
+        return parse_problem_readme(os.read(fd, HEADER_LIMIT_BYTES), lambda: _read_all(fd))
+    except (OSError, UnicodeDecodeError):
+        return None
+    finally:
+        os.close(fd)
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""증분 업데이트용 상태 파일 - 마지막 처리 커밋과 문제별 파싱 결과 저장"""
+import hashlib
+import json
+import subprocess
+from pathlib import Path
+
+from problem_parser import ProblemInfo
+from readme_writer import ARCHIVE_DIR, write_if_changed
+from run_metrics import log, metrics
+from user_model import UserRecord
+
+STATE_PATH = Path('.github') / 'readme-state.json'
+STATE_VERSION = 3
+
+
+def run_git(args, repo_root='.'):
+    """git 명령 실행 후 stdout 반환 (실패하면 None)"""
+    metrics.count('git_subprocesses')
+    try:
+        result = subprocess.run(
+            ['git', '-c', 'core.quotePath=false'] + args, cwd=repo_root,
+            capture_output=True, text=True, encoding='utf-8'
+        )
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout
+
+
+class CatFile:
+    """`git cat-file --batch` 프로세스 하나로 객체를 계속 읽는 파이프"""
+
+    def __init__(self, repo_root='.'):
+        metrics.count('git_subprocesses')
+        self.process = subprocess.Popen(
+            ['git', 'cat-file', '--batch'], cwd=repo_root,
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+
+    def read(self, sha):
+        """객체 sha -> (종류, 내용 bytes) (없으면 None)"""
+        self.process.stdin.write(sha.encode('ascii') + b'\n')
+        self.process.stdin.flush()
+        header = self.process.stdout.readline().split()
+        if len(header) != 3:
+            # '<sha> missing' 또는 프로세스 종료
+            return None
+        content = self.process.stdout.read(int(header[2]) + 1)[:-1]
+        metrics.count('git_objects_read')
+        return header[1].decode('ascii'), content
+
+    def close(self):
+        if self.process.poll() is None:
+            self.process.stdin.close()
+            self.process.wait()
+            self.process.stdout.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def problem_key(path):
+    """'<user>/<num>/...' 경로에서 '<user>/<num>' 키 추출 (문제 폴더가 아니면 None)"""
+    parts = path.split('/')
+    if len(parts) >= 3 and not parts[0].startswith('.') and parts[1].isdigit():
+        return f"{parts[0]}/{parts[1]}"
+    return None
+
+
+def problem_blobs(repo_root='.'):
+    """현재 트리의 문제 README blob 목록 {'<user>/<num>': blob} (git 없으면 None)"""
+    tracked = run_git(['ls-files', '-s'], repo_root)
+    untracked = run_git(['ls-files', '--others', '--exclude-standard'], repo_root)
+    if tracked is None or untracked is None:
+        return None
+
+    blobs = {}
+    for line in tracked.splitlines():
+        # '<mode> <blob> <stage>\t<path>'
+        info, _, path = line.partition('\t')
+        key = problem_key(path)
+        if key and path.count('/') == 2 and path.endswith('/README.md'):
+            blobs[key] = info.split()[1]
+    for path in untracked.splitlines():
+        key = problem_key(path)
+        if key and path.count('/') == 2 and path.endswith('/README.md'):
+            blobs[key] = 'untracked'
+    return blobs
+
+
+def blobs_checksum(blobs):
+    """문제 README blob 목록의 체크섬"""
+    digest = hashlib.sha256()
+    for key in sorted(blobs):
+        digest.update(f"{key} {blobs[key]}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def changed_paths_since(commit, repo_root='.'):
+    """commit 이후 바뀐 경로 목록 (커밋된 변경 + 작업 트리 변경 + 새 파일)"""
+    # 'git diff <commit>'은 commit과 작업 트리를 비교하므로 HEAD까지의 커밋도 포함됨
+    diff = run_git(['diff', '--name-only', commit], repo_root)
+    untracked = run_git(['ls-files', '--others', '--exclude-standard'], repo_root)
+    if diff is None or untracked is None:
+        return None
+
+    paths = set()
+    for path in diff.splitlines() + untracked.splitlines():
+        parts = path.split('/')
+        # 루트 파일, .github, 자동 생성되는 <user>/README.md, <user>/history/ 는 데이터에 영향 없음
+        if len(parts) < 2 or parts[0].startswith('.'):
+            continue
+        if (len(parts) == 2 and parts[1] == 'README.md') or parts[1] == ARCHIVE_DIR:
+            continue
+        paths.add(path)
+    return paths
+
+
+class ReadmeState:
+    """마지막 실행 결과 (커밋, 사용자별 문제 목록, 문제별 메타데이터, 통계)"""
+
+    def __init__(self, commit=None, users=None, problems=None, blobs=None, stats=None, stats_date=None):
+        self.commit = commit
+        self.users = users or {}
+        self.problems = problems or {}
+        self.blobs = blobs or {}
+        self.stats = stats or {}
+        self.stats_date = stats_date
+
+    @classmethod
+    def load(cls, path=STATE_PATH):
+        """상태 파일 읽기 (없거나 손상되었으면 None)"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            metrics.count('files_read')
+        except (OSError, ValueError):
+            return None
+        if data.get('version') != STATE_VERSION or not data.get('commit'):
+            return None
+        blobs = data.get('blobs', {})
+        if data.get('checksum') != blobs_checksum(blobs):
+            log.warn("⚠️ 상태 파일 체크섬 불일치, 전체 재빌드 필요")
+            return None
+        return cls(data['commit'], data.get('users'), data.get('problems'), blobs,
+                   data.get('stats'), data.get('stats_date'))
+
+    @classmethod
+    def from_run(cls, commit, users_data, blobs, stats_date):
+        """이번 실행 결과로 상태 생성"""
+        users = {}
+        problems = {}
+        stats = {}
+        for username, user_data in users_data.items():
+            keys = []
+            for problem in user_data.problems:
+                key = problem.folder
+                keys.append(key)
+                problems[key] = problem.to_dict()
+            users[username] = keys
+            if user_data.stats is not None:
+                stats[username] = user_data.stats
+        return cls(commit, users, problems, blobs, stats, stats_date)
+
+    def user_data(self, username):
+        """저장된 문제 목록으로 사용자 데이터 복원"""
+        problems = [ProblemInfo.from_dict(self.problems[key]) for key in self.users[username]]
+        return UserRecord(username, problems)
+
+    def matches_tree(self, users_data, affected_users, current_blobs):
+        """증분 결과가 현재 트리와 일치하는지 체크섬으로 확인"""
+        merged = {}
+        for key, blob in self.blobs.items():
+            if key.split('/', 1)[0] not in affected_users:
+                merged[key] = blob
+        for key, blob in current_blobs.items():
+            if key.split('/', 1)[0] in affected_users:
+                merged[key] = blob
+        # 삭제된 사용자 폴더도 확인
+        merged = {key: blob for key, blob in merged.items() if key.split('/', 1)[0] in users_data}
+        return blobs_checksum(merged) == blobs_checksum(current_blobs)
+
+    def save(self, path=STATE_PATH):
+        """상태 파일 저장 (내용이 바뀐 경우에만 기록)"""
+        data = {
+            'version': STATE_VERSION,
+            'commit': self.commit,
+            'checksum': blobs_checksum(self.blobs),
+            'stats_date': self.stats_date,
+            'users': self.users,
+            'problems': self.problems,
+            'blobs': self.blobs,
+            'stats': self.stats,
+        }
+        return write_if_changed(path, json.dumps(data, ensure_ascii=False, indent=1, sort_keys=True) + '\n')
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""문제 README 변경 감시 - watchdog(inotify 등)이 있으면 이벤트, 없으면 주기적 stat 폴링
+
+감시 대상은 `<사용자>/<문제 번호>/README.md` 뿐이다.
+(생성되는 `<사용자>/README.md`와 메인 README는 대상이 아니므로 다시 쓰더라도 이벤트가 돌지 않는다)
+"""
+import os
+import threading
+import time
+
+from run_metrics import log
+
+POLL_INTERVAL = 0.3
+# 편집기가 저장을 여러 단계(임시 파일 + rename 등)로 나눠 하는 경우를 한 번에 모으는 시간
+SETTLE_SECONDS = 0.05
+
+
+def problem_readme_key(path, root='.'):
+    """경로가 문제 README면 'user/num/README.md' 형태의 상대 경로, 아니면 None"""
+    relative = os.path.relpath(path, root).replace(os.sep, '/')
+    parts = relative.split('/')
+    if (len(parts) == 3 and parts[2] == 'README.md' and parts[1].isdigit()
+            and not parts[0].startswith('.')):
+        return relative
+    return None
+
+
+def snapshot(root='.'):
+    """문제 README 경로 -> (mtime_ns, 크기)"""
+    result = {}
+    try:
+        users = [entry for entry in os.scandir(root) if entry.is_dir() and not entry.name.startswith('.')]
+    except OSError:
+        return result
+    for user in users:
+        try:
+            problems = [entry for entry in os.scandir(user.path) if entry.is_dir() and entry.name.isdigit()]
+        except OSError:
+            continue
+        for problem in problems:
+            try:
+                stat = os.stat(os.path.join(problem.path, 'README.md'))
+            except OSError:
+                continue
+            result[f"{user.name}/{problem.name}/README.md"] = (stat.st_mtime_ns, stat.st_size)
+    return result
+
+
+class PollingWatcher:
+    """interval마다 문제 README들을 stat해서 추가/수정/삭제를 찾는 감시기"""
+
+    def __init__(self, root='.', interval=POLL_INTERVAL):
+        self.root = root
+        self.interval = interval
+        self.previous = snapshot(root)
+
+    def _diff(self):
+        current = snapshot(self.root)
+        changed = {path for path, stat in current.items() if self.previous.get(path) != stat}
+        changed.update(path for path in self.previous if path not in current)
+        self.previous = current
+        return changed
+
+    def wait(self):
+        """변경이 생길 때까지 기다렸다가 바뀐 경로 집합 반환"""
+        while True:
+            time.sleep(self.interval)
+            changed = self._diff()
+            if changed:
+                time.sleep(SETTLE_SECONDS)
+                changed |= self._diff()
+                return changed
+
+    def close(self):
+        pass
+
+
+class EventWatcher:
+    """watchdog 옵저버(리눅스에서는 inotify)로 이벤트를 받아 모으는 감시기"""
+
+    def __init__(self, root='.'):
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+
+        self.root = root
+        self.pending = set()
+        self.condition = threading.Condition()
+        watcher = self
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                paths = [event.src_path, getattr(event, 'dest_path', '')]
+                watcher._add([path for path in paths if path])
+
+        self.observer = Observer()
+        self.observer.schedule(Handler(), root, recursive=True)
+        self.observer.start()
+
+    def _add(self, paths):
+        keys = [key for key in (problem_readme_key(path, self.root) for path in paths) if key]
+        if keys:
+            with self.condition:
+                self.pending.update(keys)
+                self.condition.notify()
+
+    def wait(self):
+        """이벤트가 들어올 때까지 기다렸다가 바뀐 경로 집합 반환"""
+        with self.condition:
+            while not self.pending:
+                self.condition.wait()
+        time.sleep(SETTLE_SECONDS)
+        with self.condition:
+            changed, self.pending = self.pending, set()
+        return changed
+
+    def close(self):
+        self.observer.stop()
+        self.observer.join()
+
+
+def create_watcher(root='.', interval=POLL_INTERVAL, polling=False):
+    """watchdog이 있으면 이벤트 감시기, 없거나 polling=True면 폴링 감시기"""
+    if not polling:
+        try:
+            watcher = EventWatcher(root)
+            log.info("👀 파일 이벤트로 감시 중 (watchdog)")
+            return watcher
+        except ImportError:
+            log.warn("⚠️ watchdog 없음, 폴링으로 감시")
+        except OSError as e:
+            log.warn(f"⚠️ 파일 이벤트 감시 실패 ({e}), 폴링으로 감시")
+    log.info(f"👀 {interval}초마다 폴링으로 감시 중")
+    return PollingWatcher(root, interval)
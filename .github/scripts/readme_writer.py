@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""README 쓰기 - 내용이 바뀐 파일만 원자적으로 기록하고 목록을 남김"""
+import filecmp
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+from run_metrics import metrics
+
+# 지난 달 풀이 기록 보관 폴더 (<user>/history/YYYY-MM.md)
+ARCHIVE_DIR = 'history'
+
+# 이번 실행에서 실제로 내용이 바뀐(삭제 포함) 파일들 (기록 순서 유지)
+changed_files = []
+
+
+def is_unchanged(path, data):
+    """디스크의 파일 내용이 data(bytes)와 같은지 확인 (크기부터 비교)"""
+    try:
+        if os.path.getsize(path) != len(data):
+            return False
+        with open(path, 'rb') as f:
+            metrics.count('files_read')
+            return f.read() == data
+    except OSError:
+        return False
+
+
+def write_if_changed(path, content):
+    """내용이 다를 때만 임시 파일 + rename으로 원자적으로 기록, 기록 여부 반환"""
+    path = Path(path)
+    data = content.encode('utf-8')
+    if is_unchanged(path, data):
+        return False
+
+    fd, tmp_path = _temp_file(path)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        _replace(tmp_path, path)
+    except BaseException:
+        _discard(tmp_path)
+        raise
+    return True
+
+
+@contextmanager
+def streamed_write(path):
+    """with 블록에서 텍스트 파일 객체에 조금씩 쓰고, 끝나면 기존 파일과 다를 때만 교체
+
+    내용 전체를 메모리에 모으지 않는 큰 파일용이며, 교체 여부는 changed_files에 남는다.
+    """
+    path = Path(path)
+    fd, tmp_path = _temp_file(path)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='\n') as f:
+            yield f
+        if path.is_file():
+            metrics.count('files_read')
+            if filecmp.cmp(tmp_path, path, shallow=False):
+                _discard(tmp_path)
+                return
+        _replace(tmp_path, path)
+    except BaseException:
+        _discard(tmp_path)
+        raise
+
+
+def _temp_file(path):
+    """path와 같은 디렉터리의 임시 파일 (같은 디렉터리여야 os.replace가 원자적으로 동작)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+
+
+def _replace(tmp_path, path):
+    """임시 파일을 권한을 맞춰 path로 옮기고 바뀐 파일 목록에 추가"""
+    if path.exists():
+        os.chmod(tmp_path, path.stat().st_mode & 0o777)
+    else:
+        os.chmod(tmp_path, 0o644)
+    os.replace(tmp_path, path)
+    metrics.count('files_written')
+    changed_files.append(path.as_posix())
+
+
+def _discard(tmp_path):
+    try:
+        os.unlink(tmp_path)
+    except OSError:
+        pass
+
+
+def read_first_line(path):
+    """파일의 첫 줄 (개행 제외, 없으면 None) - 지문 비교용"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            metrics.count('files_read')
+            return f.readline().rstrip('\n')
+    except OSError:
+        return None
+
+
+def remove_file(path):
+    """자동 생성 파일 삭제 (삭제했으면 바뀐 파일 목록에 추가)"""
+    path = Path(path)
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        return False
+    metrics.count('files_written')
+    changed_files.append(path.as_posix())
+    return True
+
+
+def write_changed_list(path):
+    """바뀐 파일 목록을 한 줄에 하나씩 기록 (워크플로에서 그대로 git add)"""
+    with open(path, 'w', encoding='utf-8') as f:
+        for changed in changed_files:
+            f.write(f"{changed}\n")
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""실행 계측 - 단계별 시간, git 프로세스 / 파일 입출력 횟수, 출력 수준 조절"""
+import json
+import sys
+import time
+from contextlib import contextmanager
+
+QUIET, NORMAL, VERBOSE = 0, 1, 2
+
+
+class RunMetrics:
+    """한 번의 실행 동안 모은 단계별 시간과 카운터"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.started = time.perf_counter()
+        self.phases = {}
+        self.counters = {
+            'git_subprocesses': 0,
+            'files_read': 0,
+            'files_written': 0,
+            'problems_scanned': 0,
+        }
+
+    def count(self, name, amount=1):
+        """카운터 증가"""
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    @contextmanager
+    def phase(self, name):
+        """with 블록의 실행 시간을 단계 이름으로 누적 기록"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = round(self.phases.get(name, 0) + time.perf_counter() - started, 6)
+
+    def summary(self, **extra):
+        """JSON으로 내보낼 요약"""
+        data = {
+            'total_seconds': round(time.perf_counter() - self.started, 6),
+            'phases': dict(self.phases),
+            'counters': dict(self.counters),
+        }
+        data.update(extra)
+        return data
+
+    def emit(self, path=None, **extra):
+        """요약을 JSON 한 줄로 출력 (path가 있으면 파일로 기록)"""
+        output = json.dumps(self.summary(**extra), ensure_ascii=False, sort_keys=True)
+        if path:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(output + '\n')
+        else:
+            print(output)
+
+
+class RunLog:
+    """출력 수준에 따라 메시지를 거르는 로거 (--quiet / --verbose)"""
+
+    def __init__(self, level=NORMAL):
+        self.level = level
+
+    def debug(self, message):
+        """문제별 상세 정보 등 (--verbose에서만)"""
+        if self.level >= VERBOSE:
+            print(message)
+
+    def info(self, message):
+        """진행 상황 (--quiet이면 생략)"""
+        if self.level >= NORMAL:
+            print(message)
+
+    def warn(self, message):
+        """경고 (--quiet이면 생략)"""
+        if self.level >= NORMAL:
+            print(message)
+
+    def error(self, message):
+        """오류 (항상 표준 에러로 출력)"""
+        print(message, file=sys.stderr)
+
+
+metrics = RunMetrics()
+log = RunLog()
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""비슷한 풀이 찾기 - 풀이 소스를 토큰화해서 MinHash 서명 + LSH 색인으로 거의 같은 풀이 쌍을 찾음
+
+사용 예:
+    python .github/scripts/similarity.py                       # 모든 문제 폴더
+    python .github/scripts/similarity.py junho hyosang --threshold 0.7 --format markdown
+
+모든 쌍을 비교하지 않고, 서명을 밴드로 나눠 같은 버킷에 들어간 후보만 확인하므로
+풀이 수에 거의 비례하는 시간에 끝난다. 서명은 `.judge-cache/similarity.json`에
+파일 내용 해시별로 저장해서, 다시 실행하면 새로 생기거나 바뀐 풀이만 계산한다.
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from judge import CACHE_DIR, LANGUAGES, find_problem_folders
+from run_metrics import QUIET, VERBOSE, log
+
+SIMILARITY_VERSION = 1
+CACHE_PATH = CACHE_DIR / 'similarity.json'
+
+# 서명 길이 = 밴드 수 x 밴드당 행 수, 후보가 되는 유사도 기준은 대략 (1/밴드 수)^(1/행 수)
+NUM_PERMUTATIONS = 128
+# 밴드 기준이 보고 기준보다 이만큼 낮도록 밴드 크기를 고름 (기준 근처의 쌍을 놓치지 않게)
+BAND_MARGIN = 0.05
+SHINGLE_SIZE = 5
+# 토큰 조각이 이보다 적은 풀이(A+B 같은 몇 줄짜리)는 누가 써도 비슷하므로 비교하지 않음
+MIN_SHINGLES = 20
+DEFAULT_THRESHOLD = 0.8
+# 메르센 소수 2^61 - 1을 법으로 하는 해시 (a·x + b) mod p 128개, 시드 고정이라 캐시와 호환됨
+MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(SIMILARITY_VERSION)
+PERMUTATIONS = [(_rng.randrange(1, MERSENNE_PRIME), _rng.randrange(0, MERSENNE_PRIME))
+                for _ in range(NUM_PERMUTATIONS)]
+
+PYTHON_SUFFIXES = ('.py', '.py3')
+# 주석 / 문자열 / 숫자 / 식별자 / 연산자 (C 계열과 파이썬 모두)
+C_COMMENT_RE = re.compile(r'//[^\n]*|/\*.*?\*/', re.S)
+PYTHON_COMMENT_RE = re.compile(r'#[^\n]*')
+TOKEN_RE = re.compile(r'''("""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\'|"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*')'''
+                      r'|(\d[\w.]*)|([A-Za-z_]\w*)|(\S)')
+# 변수 이름을 바꿔도 같은 풀이로 보도록 이 밖의 식별자는 모두 ID로 바꿈
+KEYWORDS = frozenset('''
+    and as assert async await bool boolean break byte case catch char class const continue def default del do
+    double elif else enum except extends false final finally float fn for from global if impl import in int
+    interface is lambda let long loop match mod mut namespace new nonlocal none not null or pass private
+    protected pub public raise return self short signed sizeof static struct super switch template this throw
+    throws true try type typedef typename unsigned use using var void while with yield
+    include define vector string map set pair queue stack deque priority_queue sort min max abs
+    cin cout scanf printf endl print input range len list dict append sys stdin readline
+    println scanner bufferedreader stringtokenizer parseint
+'''.split())
+
+
+class SignedSolution:
+    """풀이 파일 하나와 MinHash 서명"""
+
+    __slots__ = ('folder', 'path', 'language', 'digest', 'shingles', 'signature')
+
+    def __init__(self, folder, path, language, digest, shingles=0, signature=None):
+        self.folder = folder
+        self.path = path
+        self.language = language
+        self.digest = digest          # 파일 내용 해시 (서명 캐시 키)
+        self.shingles = shingles      # 서로 다른 토큰 조각 수
+        self.signature = signature    # MinHash 값 NUM_PERMUTATIONS개 (조각이 너무 적으면 None)
+
+    @property
+    def name(self):
+        return f"{self.folder}/{self.path.name}"
+
+
+def tokenize(source, suffix):
+    """소스 -> 정규화된 토큰 목록 (주석 제거, 문자열/숫자/식별자 일반화)"""
+    source = (PYTHON_COMMENT_RE if suffix in PYTHON_SUFFIXES else C_COMMENT_RE).sub(' ', source)
+    tokens = []
+    for string, number, word, symbol in TOKEN_RE.findall(source):
+        if string:
+            tokens.append('STR')
+        elif number:
+            tokens.append('NUM')
+        elif word:
+            lowered = word.lower()
+            tokens.append(lowered if lowered in KEYWORDS else 'ID')
+        else:
+            tokens.append(symbol)
+    return tokens
+
+
+def shingle_hashes(tokens):
+    """연속 토큰 SHINGLE_SIZE개씩의 32비트 해시 집합 (실행마다 같은 값이 나오도록 crc32 사용)"""
+    return {
+        zlib.crc32('\x1f'.join(tokens[i:i + SHINGLE_SIZE]).encode('utf-8'))
+        for i in range(len(tokens) - SHINGLE_SIZE + 1)
+    }
+
+
+def minhash(shingles):
+    """조각 해시 집합 -> MinHash 서명"""
+    return [min((a * x + b) % MERSENNE_PRIME for x in shingles) for a, b in PERMUTATIONS]
+
+
+def sign_source(task):
+    """(경로, 확장자) -> (조각 수, 서명) (작업 프로세스에서 실행)"""
+    path, suffix = task
+    source = Path(path).read_bytes().decode('utf-8', errors='replace')
+    shingles = shingle_hashes(tokenize(source, suffix))
+    if len(shingles) < MIN_SHINGLES:
+        return len(shingles), None
+    return len(shingles), minhash(shingles)
+
+
+def find_sources(folders):
+    """문제 폴더들의 풀이 파일 목록 (내용 해시 포함, 파일 이름순)"""
+    solutions = []
+    for folder in folders:
+        for path in sorted(folder.iterdir()):
+            spec = LANGUAGES.get(path.suffix.lower())
+            if not path.is_file() or spec is None:
+                continue
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()[:24]
+            solutions.append(SignedSolution(folder.as_posix(), path, spec[0], digest))
+    return solutions
+
+
+def load_cache(path):
+    """서명 캐시 {내용 해시: [조각 수, 서명]} (없거나 설정이 다르면 빈 dict)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get('version') != SIMILARITY_VERSION or data.get('params') != cache_params():
+        return {}
+    return data.get('signatures', {})
+
+
+def save_cache(path, signatures):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'version': SIMILARITY_VERSION, 'params': cache_params(), 'signatures': signatures}, f)
+
+
+def cache_params():
+    """서명 값에 영향을 주는 설정 (바뀌면 캐시를 버림)"""
+    return [NUM_PERMUTATIONS, SHINGLE_SIZE, MIN_SHINGLES]
+
+
+def sign_solutions(solutions, workers, cache_path):
+    """풀이마다 서명을 붙임 (캐시에 없는 내용만 계산), 새로 계산한 개수 반환"""
+    cache = load_cache(cache_path)
+    missing = {}
+    for solution in solutions:
+        if solution.digest not in cache:
+            missing.setdefault(solution.digest, (str(solution.path), solution.path.suffix.lower()))
+    if missing:
+        if workers > 1 and len(missing) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                signed = list(executor.map(sign_source, missing.values()))
+        else:
+            signed = [sign_source(task) for task in missing.values()]
+        for digest, (shingles, signature) in zip(missing, signed):
+            cache[digest] = [shingles, signature]
+
+    for solution in solutions:
+        solution.shingles, solution.signature = cache[solution.digest]
+    # 지금 있는 풀이의 서명만 남겨서 캐시가 계속 커지지 않게 함
+    save_cache(cache_path, {solution.digest: cache[solution.digest] for solution in solutions})
+    return len(missing)
+
+
+def estimate_similarity(first, second):
+    """두 서명에서 추정한 자카드 유사도 (같은 위치 값이 같은 비율)"""
+    return sum(x == y for x, y in zip(first, second)) / NUM_PERMUTATIONS
+
+
+def band_rows(threshold):
+    """보고 기준에 맞는 밴드당 행 수 (행이 많을수록 후보가 적고, 기준이 낮으면 행을 줄임)"""
+    rows = 1
+    while (NUM_PERMUTATIONS % (rows * 2) == 0
+           and (rows * 2 / NUM_PERMUTATIONS) ** (1 / (rows * 2)) <= threshold - BAND_MARGIN):
+        rows *= 2
+    return rows
+
+
+def candidate_pairs(solutions, rows):
+    """LSH - 밴드(행 rows개) 하나라도 통째로 같은 풀이 쌍 (인덱스 쌍 집합)"""
+    pairs = set()
+    for start in range(0, NUM_PERMUTATIONS, rows):
+        buckets = {}
+        for index, solution in enumerate(solutions):
+            buckets.setdefault(tuple(solution.signature[start:start + rows]), []).append(index)
+        for members in buckets.values():
+            for i, first in enumerate(members):
+                for second in members[i + 1:]:
+                    pairs.add((first, second))
+    return pairs
+
+
+def find_similar(solutions, threshold, same_user=False):
+    """유사도가 threshold 이상인 풀이 쌍 목록 (유사도 높은 순)"""
+    signed = [solution for solution in solutions if solution.signature is not None]
+    results = []
+    for i, j in candidate_pairs(signed, band_rows(threshold)):
+        first, second = signed[i], signed[j]
+        if not same_user and first.folder.split('/')[0] == second.folder.split('/')[0]:
+            continue
+        similarity = estimate_similarity(first.signature, second.signature)
+        if similarity >= threshold:
+            if second.name < first.name:
+                first, second = second, first
+            results.append({
+                'similarity': round(similarity, 3),
+                'first': first.name,
+                'second': second.name,
+                'same_problem': first.folder.split('/')[-1] == second.folder.split('/')[-1],
+                'languages': [first.language, second.language],
+            })
+    results.sort(key=lambda pair: (-pair['similarity'], pair['first'], pair['second']))
+    return results
+
+
+def render_markdown(pairs):
+    """결과를 README에 붙일 수 있는 표로 변환"""
+    lines = ["| 유사도 | 풀이 1 | 풀이 2 | 같은 문제 |", "|--------|--------|--------|-----------|"]
+    for pair in pairs:
+        lines.append(f"| {pair['similarity'] * 100:.1f}% | {pair['first']} | {pair['second']} "
+                     f"| {'✅' if pair['same_problem'] else ''} |")
+    return "\n".join(lines) + "\n"
+
+
+def parse_args():
+    """명령행 옵션 파싱"""
+    parser = argparse.ArgumentParser(description='MinHash/LSH로 거의 같은 풀이 쌍 찾기')
+    parser.add_argument('targets', nargs='*', help='문제 폴더 또는 사용자 폴더 (없으면 전체)')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='보고할 최소 추정 유사도 (0~1)')
+    parser.add_argument('--same-user', action='store_true', help='같은 참여자의 풀이끼리도 비교')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='서명 계산 프로세스 수')
+    parser.add_argument('--cache', default=str(CACHE_PATH), help='서명 캐시 파일')
+    parser.add_argument('--format', choices=('json', 'markdown'), default='json', help='출력 형식')
+    parser.add_argument('--output', metavar='PATH', help='결과를 표준 출력 대신 이 경로에 기록')
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument('-q', '--quiet', action='store_true', help='결과만 출력')
+    verbosity.add_argument('-v', '--verbose', action='store_true', help='풀이별 조각 수까지 출력')
+    args = parser.parse_args()
+    if not 0 < args.threshold <= 1:
+        parser.error('--threshold는 0보다 크고 1 이하여야 함')
+    return args
+
+
+def main():
+    args = parse_args()
+    # 결과를 표준 출력으로 내보낼 때는 진행 로그를 섞지 않음 (오류는 stderr)
+    if args.quiet or (not args.output and not args.verbose):
+        log.level = QUIET
+    elif args.verbose:
+        log.level = VERBOSE
+
+    started = time.perf_counter()
+    solutions = find_sources(find_problem_folders(args.targets))
+    log.info(f"🔎 풀이 {len(solutions)}개 비교 중...")
+    computed = sign_solutions(solutions, args.workers, args.cache)
+    for solution in solutions:
+        log.debug(f"  {solution.name}: 조각 {solution.shingles}개{'' if solution.signature else ' (너무 짧아서 제외)'}")
+    pairs = find_similar(solutions, args.threshold, args.same_user)
+
+    if args.format == 'markdown':
+        output = render_markdown(pairs)
+    else:
+        output = json.dumps({
+            'version': SIMILARITY_VERSION,
+            'threshold': args.threshold,
+            'pairs': pairs,
+        }, ensure_ascii=False, indent=2) + '\n'
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output)
+    else:
+        print(output, end='')
+    skipped = sum(solution.signature is None for solution in solutions)
+    log.info(f"✅ 비슷한 쌍 {len(pairs)}개 (새로 계산 {computed}개, 짧아서 제외 {skipped}개, "
+             f"{time.perf_counter() - started:.2f}초)")
+
+
+if __name__ == '__main__':
+    main()
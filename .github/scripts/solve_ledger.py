@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""풀이 원장 - 한 번 확정된 (사용자, 문제, 풀이 날짜)를 커밋되는 TSV에 추가만 하는 기록
+
+    # .github/solves.tsv
+    user	problem	date
+    junho	1000	2025-07-21
+
+원장에 있는 문제는 git 히스토리를 다시 조회하지 않으므로 워크플로가 얕은 클론으로도 동작한다.
+이미 기록된 줄은 고치지 않고, 새로 확정된 풀이만 파일 끝에 덧붙인다.
+"""
+from pathlib import Path
+
+from readme_writer import write_if_changed
+from run_metrics import metrics
+
+LEDGER_PATH = Path('.github') / 'solves.tsv'
+LEDGER_HEADER = "# 풀이 원장 (자동 생성, 추가만 함) - 날짜는 첫 커밋의 한국 시간 기준 (오전 4시 이전은 전날)\nuser\tproblem\tdate\n"
+
+
+class SolveLedger:
+    """문제 폴더('user/num') -> 풀이 날짜, 이번 실행에서 새로 확정된 풀이 목록"""
+
+    def __init__(self, path=LEDGER_PATH, dates=None, text=''):
+        self.path = Path(path)
+        self.dates = dates if dates is not None else {}
+        self.text = text
+        self.pending = []
+
+    @classmethod
+    def load(cls, path=LEDGER_PATH):
+        """원장 읽기 (없으면 빈 원장, 형식이 틀린 줄은 무시)"""
+        path = Path(path)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                text = f.read()
+        except OSError:
+            return cls(path)
+        metrics.count('files_read')
+
+        dates = {}
+        for line in text.splitlines():
+            fields = line.split('\t')
+            if len(fields) != 3 or line.startswith('#') or fields == ['user', 'problem', 'date']:
+                continue
+            # 같은 문제가 두 번 기록되어 있으면 먼저 기록된 날짜를 사용
+            dates.setdefault(f"{fields[0]}/{fields[1]}", fields[2])
+        return cls(path, dates, text)
+
+    def get(self, folder):
+        """문제 폴더의 풀이 날짜 (없으면 None)"""
+        return self.dates.get(folder)
+
+    def __contains__(self, folder):
+        return folder in self.dates
+
+    def __len__(self):
+        return len(self.dates)
+
+    def record(self, folder, solved_on):
+        """커밋 기록으로 확정된 풀이 날짜 추가 (이미 있으면 무시)"""
+        if folder not in self.dates:
+            self.dates[folder] = solved_on
+            self.pending.append(folder)
+
+    def save(self):
+        """새로 확정된 풀이를 파일 끝에 덧붙여 기록 (새 풀이가 없으면 아무것도 안 함)"""
+        if not self.pending:
+            return False
+        lines = []
+        for folder in sorted(self.pending, key=lambda key: (self.dates[key], key)):
+            user, _, problem = folder.partition('/')
+            lines.append(f"{user}\t{problem}\t{self.dates[folder]}\n")
+        text = self.text or LEDGER_HEADER
+        if not text.endswith('\n'):
+            text += '\n'
+        self.text = text + ''.join(lines)
+        self.pending = []
+        return write_if_changed(self.path, self.text)
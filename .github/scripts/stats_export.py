@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""통계 내보내기 - README와 같은 메모리 모델에서 대시보드용 JSON / NDJSON 파일 생성
+
+    <dir>/stats.json     전체 요약 + 사용자별 통계 + 문제별 기록 (버전 필드 포함)
+    <dir>/solves.ndjson  풀이 이벤트 한 줄에 하나 (날짜순)
+
+두 파일 모두 항목을 하나씩 직렬화해서 임시 파일에 흘려 쓰고, 내용이 바뀐 경우에만 교체한다.
+"""
+import heapq
+import json
+from pathlib import Path
+
+from problem_catalog import TIER_GROUPS, tier_group
+from readme_writer import streamed_write
+
+EXPORT_VERSION = 1
+STATS_FILE = 'stats.json'
+SOLVES_FILE = 'solves.ndjson'
+
+# stats.json 안의 사용자 통계 키 (README 통계 dict와 같은 이름)
+STAT_FIELDS = ('first_date', 'total_weekdays', 'success_days', 'failure_days', 'success_rate',
+               'current_streak', 'longest_streak', 'fine')
+
+
+def _dumps(value):
+    return json.dumps(value, ensure_ascii=False, sort_keys=True)
+
+
+def user_entry(user_data):
+    """사용자 기록 -> stats.json의 사용자 항목"""
+    stats = user_data.stats or {}
+    tiers = dict.fromkeys(TIER_GROUPS + ('Unknown',), 0)
+    for tier, count in enumerate(user_data.tier_counts()):
+        tiers[tier_group(tier)] += count
+    entry = {field: stats.get(field) for field in STAT_FIELDS}
+    entry['success_rate'] = round(entry['success_rate'] or 0, 1)
+    entry.update(
+        problems=user_data.total_count,
+        last_update=user_data.last_update,
+        tiers={group: count for group, count in tiers.items() if count},
+    )
+    return entry
+
+
+def problem_entry(entry):
+    """카탈로그 항목 -> stats.json의 문제 항목"""
+    return {
+        'title': entry.title,
+        'tier': entry.tier,
+        'difficulty': entry.difficulty,
+        'solvers': entry.solvers,
+    }
+
+
+def _user_events(username, user_data):
+    """사용자 한 명의 (날짜, 사용자, 순서, 문제) 목록 - 이미 날짜순"""
+    return ((problem.date, username, index, problem) for index, problem in enumerate(user_data.problems))
+
+
+def solve_events(users_data):
+    """모든 사용자의 풀이를 날짜순으로 하나씩 (사용자별 목록은 이미 날짜순이라 병합만 함)"""
+    streams = [_user_events(username, user_data) for username, user_data in users_data.items()]
+    for solved_on, username, _, problem in heapq.merge(*streams, key=lambda item: item[:3]):
+        yield {
+            'date': solved_on,
+            'user': username,
+            'problem': problem.number,
+            'title': problem.title,
+            'tier': problem.tier,
+            'category': problem.category,
+            'attempts': problem.attempts,
+            'time_spent': problem.time_spent,
+        }
+
+
+def write_stats(path, users_data, catalog, summary, generated_on):
+    """stats.json - 섹션을 항목 단위로 직렬화해서 기록"""
+    with streamed_write(path) as f:
+        f.write(f'{{"version": {EXPORT_VERSION}, "generated_on": {_dumps(generated_on)},\n')
+        summary = dict(summary, participants=len(users_data), unique_problems=len(catalog),
+                       tier_distribution={group: {'problems': problems, 'solves': solves}
+                                          for group, (problems, solves) in catalog.tier_distribution().items()})
+        f.write(f' "summary": {_dumps(summary)},\n "users": {{')
+        for i, username in enumerate(sorted(users_data)):
+            f.write(f'{"," if i else ""}\n  {_dumps(username)}: {_dumps(user_entry(users_data[username]))}')
+        f.write('\n },\n "problems": {')
+        for i, entry in enumerate(sorted(catalog.entries.values(), key=lambda entry: int(entry.number))):
+            f.write(f'{"," if i else ""}\n  {_dumps(entry.number)}: {_dumps(problem_entry(entry))}')
+        f.write('\n }\n}\n')
+
+
+def write_solves(path, users_data):
+    """solves.ndjson - 풀이 이벤트를 한 줄씩 기록"""
+    with streamed_write(path) as f:
+        for event in solve_events(users_data):
+            f.write(_dumps(event) + '\n')
+
+
+def export_stats(directory, users_data, catalog, summary, generated_on):
+    """내보내기 폴더에 stats.json / solves.ndjson 기록"""
+    directory = Path(directory)
+    write_stats(directory / STATS_FILE, users_data, catalog, summary, generated_on)
+    write_solves(directory / SOLVES_FILE, users_data)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""출석 계산용 평일 달력 - 날짜를 하나씩 만들지 않고 닫힌 식으로 평일 수 계산
+
+휴일/면제일 파일 (선택, PyYAML 필요):
+
+    # .github/holidays.yml
+    holidays:          # 모든 참여자에게 적용되는 휴일 (예: 공휴일)
+      - 2025-08-15
+    excused:           # 참여자별 면제일
+      junho:
+        - 2025-08-01
+"""
+from bisect import bisect_left, bisect_right
+from datetime import date
+from pathlib import Path
+
+from run_metrics import log, metrics
+
+HOLIDAYS_PATH = Path('.github') / 'holidays.yml'
+
+
+def count_weekdays(start, end):
+    """start ~ end (양 끝 포함) 사이의 평일(월~금) 수"""
+    if start > end:
+        return 0
+    days = (end - start).days + 1
+    full_weeks, remainder = divmod(days, 7)
+    count = full_weeks * 5
+    # 남은 날들: start 요일부터 remainder일
+    first_weekday = start.weekday()
+    for offset in range(remainder):
+        if (first_weekday + offset) % 7 < 5:
+            count += 1
+    return count
+
+
+def _to_date(value):
+    """YAML 값(date 또는 'YYYY-MM-DD' 문자열)을 date로 변환"""
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value).strip())
+
+
+class StudyCalendar:
+    """평일 - (휴일 + 참여자별 면제일)을 출석 평가일로 보는 달력"""
+
+    def __init__(self, holidays=(), excused=None):
+        # 주말은 원래 평가일이 아니므로 평일인 휴일만 정렬해서 보관
+        self.holidays = sorted({d for d in holidays if d.weekday() < 5})
+        self.excused = {}
+        holiday_set = set(self.holidays)
+        for username, days in (excused or {}).items():
+            self.excused[username] = sorted({d for d in days if d.weekday() < 5} - holiday_set)
+
+    @classmethod
+    def load(cls, path=HOLIDAYS_PATH):
+        """휴일 파일 읽기 (없으면 휴일 없는 기본 달력)"""
+        path = Path(path)
+        if not path.exists():
+            return cls()
+        try:
+            import yaml
+        except ImportError:
+            log.warn(f"⚠️ PyYAML 없음, {path} 무시")
+            return cls()
+
+        with open(path, 'r', encoding='utf-8') as f:
+            data = yaml.safe_load(f) or {}
+        metrics.count('files_read')
+        holidays = [_to_date(d) for d in data.get('holidays') or []]
+        excused = {
+            str(username): [_to_date(d) for d in days or []]
+            for username, days in (data.get('excused') or {}).items()
+        }
+        return cls(holidays, excused)
+
+    def _exempt_lists(self, username):
+        """해당 참여자에게 적용되는 (정렬된) 제외일 목록들"""
+        if username in self.excused:
+            return (self.holidays, self.excused[username])
+        return (self.holidays,)
+
+    def exempt_days(self, start, end, username=None):
+        """start ~ end (양 끝 포함) 사이의 평일 제외일 (휴일 + 면제일)"""
+        days = []
+        for exempt in self._exempt_lists(username):
+            days.extend(exempt[bisect_left(exempt, start):bisect_right(exempt, end)])
+        return days
+
+    def count_business_days(self, start, end, username=None):
+        """start ~ end (양 끝 포함) 사이의 평가일 수 - O(log 휴일 수)"""
+        if start > end:
+            return 0
+        count = count_weekdays(start, end)
+        for days in self._exempt_lists(username):
+            count -= bisect_right(days, end) - bisect_left(days, start)
+        return count
@@ -1,45 +1,91 @@
 #!/usr/bin/env python3
-import re
+import argparse
+import hashlib
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+from attendance import Attendance
+from git_history import GitHistoryIndex, shallow_commits
+from problem_catalog import ProblemCatalog
+from problem_parser import ProblemInfo, read_problem_info
+from solve_ledger import SolveLedger
+from study_calendar import StudyCalendar
+from readme_writer import (ARCHIVE_DIR, changed_files, read_first_line, remove_file, write_changed_list,
+                           write_if_changed)
+from readme_state import ReadmeState, changed_paths_since, problem_blobs, run_git
+from run_metrics import QUIET, VERBOSE, log, metrics
+from user_model import UserRecord
+
 # 한국 시간대 설정 (GitHub Actions 호환성)
 try:
     from zoneinfo import ZoneInfo
     KST = ZoneInfo('Asia/Seoul')
-    print("✅ zoneinfo 사용")
+    log.debug("✅ zoneinfo 사용")
 except ImportError:
     # zoneinfo 없는 경우 fallback
-    print("⚠️ zoneinfo 없음, UTC+9 직접 계산 사용")
+    log.warn("⚠️ zoneinfo 없음, UTC+9 직접 계산 사용")
     KST = None
 except:
     # 완전 fallback - UTC+9 시간 직접 계산
-    print("⚠️ 시간대 라이브러리 없음, UTC+9 직접 계산 사용")
+    log.warn("⚠️ 시간대 라이브러리 없음, UTC+9 직접 계산 사용")
     KST = None
 
+# git %ai 형식과 zoneinfo가 없을 때 쓰는 한국 시간 오프셋
+GIT_TIME_FORMAT = '%Y-%m-%d %H:%M:%S %z'
+KST_OFFSET = timezone(timedelta(hours=9))
+# 커밋 시간 문자열 -> 스터디 날짜 (실행 동안 유지)
+_commit_dates = {}
+
+# 메인 README에서 이 마커부터 끝까지가 자동 생성 영역
+GENERATED_SECTION_MARKER = '\n## 👥 참여자'
+
+# 원장에 없는 문제가 이보다 많으면 pathspec 대신 전체 히스토리를 한 번 읽음
+PATHSPEC_LIMIT = 200
+# 얕은 클론에서 경계 밖의 첫 커밋을 찾을 때 한 번에 더 받아올 커밋 수와 시도 횟수 (그 뒤에는 전체)
+DEEPEN_STEP = 100
+DEEPEN_ATTEMPTS = 3
+
+# 지난 달 보관 파일(<user>/history/YYYY-MM.md) 첫 줄에 기록하는 지문
+ARCHIVE_DIGEST_PREFIX = '<!-- archive-digest: '
+ARCHIVE_VERSION = 1
+
+# 한 번의 실행 동안 사용할 현재 시각 (실행마다 한 번만 측정)
+_run_clock = None
+
+def reset_run_clock():
+    """다음 get_korea_now() 호출에서 현재 시각을 다시 측정"""
+    global _run_clock
+    _run_clock = None
+
+def set_run_clock(korea_now):
+    """이번 실행의 현재 시각(한국 시간)을 고정 - 벤치마크처럼 날짜와 무관하게 재현해야 할 때"""
+    global _run_clock
+    _run_clock = korea_now
+
 def get_korea_now():
-    """GitHub Actions 환경 호환 한국 시간 가져오기"""
+    """GitHub Actions 환경 호환 한국 시간 가져오기 (실행당 한 번 측정한 값)"""
+    global _run_clock
+    if _run_clock is not None:
+        return _run_clock
+    
     utc_now = datetime.utcnow()
-    print(f"🕐 UTC 시간: {utc_now}")
+    log.debug(f"🕐 UTC 시간: {utc_now}")
     
     if KST is None:
         # 직접 UTC+9 계산
         korea_now = utc_now + timedelta(hours=9)
-        print(f"🇰🇷 한국 시간 (UTC+9): {korea_now}")
+        log.debug(f"🇰🇷 한국 시간 (UTC+9): {korea_now}")
     else:
         # 한국 시간대로 변환
         korea_now = utc_now.replace(tzinfo=timezone.utc).astimezone(KST).replace(tzinfo=None)
-        print(f"🇰🇷 한국 시간 (시간대): {korea_now}")
+        log.debug(f"🇰🇷 한국 시간 (시간대): {korea_now}")
     
+    _run_clock = korea_now
     return korea_now
 
-def get_korea_today():
-    """GitHub Actions 환경 호환 한국 오늘 날짜 가져오기"""
-    korea_now = get_korea_now()
-    today = korea_now.date()
-    print(f"📅 한국 오늘: {today}")
-    return today
-
 def get_korea_today():
     """한국 시간 기준 오늘 날짜 반환"""
     return get_korea_now().date()
@@ -58,386 +104,587 @@ def convert_to_korea_time(dt):
             utc_dt = dt.astimezone(datetime.timezone.utc)
             return utc_dt.replace(tzinfo=None) + timedelta(hours=9)
 
-def get_problem_info_from_readme(readme_path):
-    """개별 문제 README에서 정보 추출"""
+def resolve_commit_date(problem_num, first_commit):
+    """Git 커밋 시간 문자열('2025-07-22 00:45:46 +0900')을 스터디 날짜(오전 4시 기준)로 변환
+
+    같은 커밋에 들어간 문제들은 시간 문자열이 같으므로 한 번만 파싱한다.
+    """
+    commit_date = _commit_dates.get(first_commit)
+    if commit_date is not None:
+        return commit_date
     try:
-        with open(readme_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        try:
+            commit_datetime = datetime.strptime(first_commit, GIT_TIME_FORMAT)
+        except ValueError:
+            # '2025-07-22T00:45:46+09:00' 같은 ISO 형식
+            commit_datetime = datetime.fromisoformat(first_commit)
         
-        # 문제 번호와 제목 추출
-        title_match = re.search(r'\[#(\d+)\.\s*(.+?)\]', content)
-        if title_match:
-            problem_num = title_match.group(1)
-            problem_title = title_match.group(2)
-        else:
-            return None
+        # 한국 시간으로 변환 (zoneinfo가 없으면 UTC+9 고정, 한국은 서머타임 없음)
+        commit_datetime_kst = commit_datetime.astimezone(KST or KST_OFFSET).replace(tzinfo=None)
         
-        # 티어 이미지에서 난이도 추출
-        tier_match = re.search(r'tier_small/(\d+)\.svg', content)
-        if tier_match:
-            tier_num = int(tier_match.group(1))
-            # 티어 번호를 난이도로 변환
-            tier_names = [
-                'Unknown',          # 0
-                'Bronze V',         # 1
-                'Bronze IV',        # 2
-                'Bronze III',       # 3
-                'Bronze II',        # 4
-                'Bronze I',         # 5
-                'Silver V',         # 6
-                'Silver IV',        # 7
-                'Silver III',       # 8
-                'Silver II',        # 9
-                'Silver I',         # 10
-                'Gold V',           # 11
-                'Gold IV',          # 12
-                'Gold III',         # 13
-                'Gold II',          # 14
-                'Gold I',           # 15
-                'Platinum V',       # 16
-                'Platinum IV',      # 17
-                'Platinum III',     # 18
-                'Platinum II',      # 19
-                'Platinum I',       # 20
-                'Diamond V',        # 21
-                'Diamond IV',       # 22
-                'Diamond III',      # 23
-                'Diamond II',       # 24
-                'Diamond I',        # 25
-                'Ruby V',           # 26
-                'Ruby IV',          # 27
-                'Ruby III',         # 28
-                'Ruby II',          # 29
-                'Ruby I'            # 30
-            ]
-            
-            if 1 <= tier_num <= 30:
-                difficulty = tier_names[tier_num]
-            else:
-                difficulty = "Unknown"
-        else:
-            difficulty = "Unknown"
+        # 오전 4시 이전이면 전날로 처리 (한국 시간 기준)
+        commit_date = (commit_datetime_kst - timedelta(hours=4)).strftime('%Y-%m-%d')
         
-        return {
-            'number': problem_num,
-            'title': problem_title,
-            'difficulty': difficulty
-        }
-    except:
+        # 디버깅 정보 출력
+        log.debug(f"🔍 {problem_num}번: 커밋시간 {first_commit} -> 한국시간 {commit_datetime_kst} -> 날짜 {commit_date}")
+        _commit_dates[first_commit] = commit_date
+        return commit_date
+    except Exception as e:
+        # 파싱 오류 시 현재 날짜 사용
+        today = get_korea_today().strftime('%Y-%m-%d')
+        log.warn(f"❌ {problem_num}번: Git 오류 {e}, 현재 날짜 사용 {today}")
+        return today
+
+def is_user_folder(path):
+    """최상위 폴더 중 사용자 폴더인지 확인"""
+    return path.is_dir() and not path.name.startswith('.') and path.name != 'README.md'
+
+def list_problem_readmes(user_folder, staged=None):
+    """사용자 폴더 안의 문제 README 경로 목록 (디렉터리 순서 유지, staged가 있으면 스테이징된 것만)"""
+    if staged is not None:
+        return staged.problem_readmes(user_folder)
+    readmes = []
+    for problem_folder in user_folder.iterdir():
+        if problem_folder.is_dir() and problem_folder.name.isdigit():
+            problem_readme = problem_folder / 'README.md'
+            if problem_readme.exists():
+                readmes.append(problem_readme)
+    return readmes
+
+def read_problem(problem_readme, staged=None):
+    """문제 README 파싱 (staged가 있으면 작업 폴더 대신 스테이징된 내용)"""
+    if staged is not None:
+        return staged.read_problem_info(problem_readme)
+    return read_problem_info(problem_readme)
+
+def scan_problem(problem_readme, history, ledger=None, staged=None):
+    """문제 README 하나를 파싱하고 풀이 날짜를 붙여서 반환 (원장에 있으면 원장의 날짜 사용)"""
+    metrics.count('problems_scanned')
+    problem_info = read_problem(problem_readme, staged)
+    if not problem_info:
         return None
+    problem_info.folder = problem_readme.parent.as_posix()
+    
+    solved_on = ledger.get(problem_info.folder) if ledger is not None else None
+    if solved_on:
+        problem_info.date = solved_on
+        return problem_info
+    
+    # Git 히스토리 인덱스에서 첫 번째 커밋 시간 가져오기 (파일 생성 시점)
+    first_commit = history.first_commit_time(problem_readme.as_posix())
+    if first_commit:
+        problem_info.date = resolve_commit_date(problem_info.number, first_commit)
+        if ledger is not None:
+            ledger.record(problem_info.folder, problem_info.date)
+    else:
+        problem_info.date = get_korea_now().strftime('%Y-%m-%d')
+        log.warn(f"⚠️ {problem_info.number}번: Git 로그 없음, 현재 날짜 사용 {problem_info.date}")
+    return problem_info
+
+def scan_problems(problem_readmes, history, workers=1, ledger=None, staged=None):
+    """문제 README들을 (필요하면 병렬로) 스캔, 입력 순서대로 결과 반환"""
+    if workers <= 1 or len(problem_readmes) <= 1:
+        return [scan_problem(problem_readme, history, ledger, staged) for problem_readme in problem_readmes]
+    
+    # 파일 읽기 / 파싱 / 날짜 변환을 스레드 풀에서 처리, map은 입력 순서를 유지
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda problem_readme: scan_problem(problem_readme, history, ledger, staged),
+                                 problem_readmes))
+
+def build_history(problem_readmes, ledger=None, limit_paths=False):
+    """문제 README들의 최초 커밋 시간 인덱스
+
+    원장에 있는 문제는 조회하지 않고, 원장이 있거나 limit_paths면 pathspec으로 필요한 경로만 읽는다.
+    얕은 클론에서 첫 커밋이 받아온 히스토리 밖에 있는 문제가 있으면 히스토리를 더 받아와서 다시 읽는다.
+    """
+    wanted = [problem_readme.as_posix() for problem_readme in problem_readmes]
+    if ledger is not None:
+        wanted = [path for path in wanted if path.rsplit('/', 1)[0] not in ledger]
+        limit_paths = True
+    if limit_paths and not wanted:
+        return GitHistoryIndex()
+    # 조회할 경로가 많으면 pathspec보다 전체 히스토리를 한 번 읽는 편이 빠름
+    paths = wanted if limit_paths and len(wanted) <= PATHSPEC_LIMIT else None
+    
+    attempts = 0
+    while True:
+        boundary = shallow_commits()
+        history = GitHistoryIndex.build('.', paths=paths, boundary_commits=boundary)
+        unresolved = history.boundary_paths.intersection(wanted)
+        if not unresolved or not boundary:
+            return history
+        attempts += 1
+        if attempts <= DEEPEN_ATTEMPTS:
+            log.info(f"📥 얕은 클론: 문제 {len(unresolved)}개의 첫 커밋이 받아온 히스토리 밖에 있음, 커밋 {DEEPEN_STEP}개 더 받아오는 중")
+            fetched = run_git(['fetch', '--quiet', f'--deepen={DEEPEN_STEP}'])
+        else:
+            log.info(f"📥 얕은 클론: 문제 {len(unresolved)}개의 첫 커밋을 찾기 위해 전체 히스토리 받아오는 중")
+            fetched = run_git(['fetch', '--quiet', '--unshallow'])
+        if fetched is None:
+            log.warn("⚠️ 히스토리를 더 받아올 수 없음, 해당 문제는 현재 날짜 사용")
+            return history
+
+def build_user_data(username, problems):
+    """문제 목록으로 사용자 기록 구성 (날짜순 정렬, 날짜는 여기서 한 번만 일 번호로 변환)"""
+    user_data = UserRecord(username, problems)
+    problems = user_data.problems
+    
+    # 디버깅 정보
+    if problems:
+        log.debug(f"📊 {username}: {len(problems)}문제, 시작일 {problems[0].date}")
+        for p in problems:
+            log.debug(f"  - {p.date}: {p.number}번 {p.title}")
+    
+    return user_data
 
-def scan_user_folders():
-    """사용자 폴더들을 스캔하여 문제 정보 수집"""
+def scan_user_folders(history=None, workers=1, ledger=None, staged=None):
+    """사용자 폴더들을 스캔하여 문제 정보 수집 (staged가 있으면 스테이징된 내용 기준)"""
     base_path = Path('.')
     users_data = {}
     
-    for user_folder in base_path.iterdir():
-        if user_folder.is_dir() and not user_folder.name.startswith('.') and user_folder.name != 'README.md':
-            username = user_folder.name
-            users_data[username] = {
-                'problems': [],
-                'total_count': 0,
-                'last_update': None
-            }
-            
-            # 각 문제 폴더 스캔
-            for problem_folder in user_folder.iterdir():
-                if problem_folder.is_dir() and problem_folder.name.isdigit():
-                    problem_readme = problem_folder / 'README.md'
-                    if problem_readme.exists():
-                        problem_info = get_problem_info_from_readme(problem_readme)
-                        if problem_info:
-                            # Git에서 첫 번째 커밋 시간 가져오기 (파일 생성 시점)
-                            try:
-                                import subprocess
-                                result = subprocess.run(
-                                    ['git', 'log', '--follow', '--format=%ai', '--reverse', str(problem_readme)],
-                                    capture_output=True, text=True
-                                )
-                                if result.returncode == 0 and result.stdout.strip():
-                                    # 첫 번째 라인이 가장 오래된 커밋
-                                    first_commit = result.stdout.strip().split('\n')[0]
-                                    commit_datetime_str = first_commit
-                                    
-                                    try:
-                                        # Git 커밋 시간 형식: '2025-07-22 00:45:46+0900'을 파싱
-                                        # '+0900' 형식을 '+09:00'으로 변환
-                                        if '+' in commit_datetime_str and commit_datetime_str.count(':') == 2:
-                                            # 시간대 부분을 올바른 형식으로 변환
-                                            datetime_part, tz_part = commit_datetime_str.rsplit('+', 1)
-                                            if len(tz_part) == 4:  # +0900 형식
-                                                tz_formatted = f"+{tz_part[:2]}:{tz_part[2:]}"  # +09:00 형식으로 변환
-                                                commit_datetime_str_formatted = f"{datetime_part}{tz_formatted}"
-                                            else:
-                                                commit_datetime_str_formatted = commit_datetime_str
-                                        else:
-                                            commit_datetime_str_formatted = commit_datetime_str
-                                        
-                                        # 커밋 시간을 파싱
-                                        commit_datetime = datetime.fromisoformat(commit_datetime_str_formatted)
-                                        
-                                        # 한국 시간으로 변환
-                                        if KST is None:
-                                            # UTC+9 직접 계산
-                                            commit_datetime_kst = commit_datetime.replace(tzinfo=None) + timedelta(hours=9)
-                                        else:
-                                            commit_datetime_kst = commit_datetime.astimezone(KST).replace(tzinfo=None)
-                                        
-                                        # 오전 4시 이전이면 전날로 처리 (한국 시간 기준)
-                                        if commit_datetime_kst.hour < 4:
-                                            commit_date = (commit_datetime_kst.date() - timedelta(days=1)).strftime('%Y-%m-%d')
-                                        else:
-                                            commit_date = commit_datetime_kst.date().strftime('%Y-%m-%d')
-                                        
-                                        # 디버깅 정보 출력
-                                        print(f"🔍 {problem_info['number']}번: 커밋시간 {first_commit} -> 한국시간 {commit_datetime_kst} -> 날짜 {commit_date}")
-                                        
-                                        problem_info['date'] = commit_date
-                                    except Exception as e:
-                                        # 파싱 오류 시 현재 날짜 사용
-                                        today = get_korea_today().strftime('%Y-%m-%d')
-                                        print(f"❌ {problem_info['number']}번: Git 오류 {e}, 현재 날짜 사용 {today}")
-                                        problem_info['date'] = today
-                                else:
-                                    problem_info['date'] = get_korea_now().strftime('%Y-%m-%d')
-                                    print(f"⚠️ {problem_info['number']}번: Git 로그 없음, 현재 날짜 사용 {problem_info['date']}")
-                            except Exception as e:
-                                problem_info['date'] = get_korea_now().strftime('%Y-%m-%d')
-                                print(f"❌ {problem_info['number']}번: Git 오류 {e}, 현재 날짜 사용 {problem_info['date']}")
-                            
-                            users_data[username]['problems'].append(problem_info)
-            
-        # 문제들을 날짜순으로 정렬
-        users_data[username]['problems'].sort(key=lambda x: x['date'])
-        users_data[username]['total_count'] = len(users_data[username]['problems'])
-        
-        # 디버깅 정보
-        if users_data[username]['problems']:
-            print(f"📊 {username}: {len(users_data[username]['problems'])}문제, 시작일 {users_data[username]['problems'][0]['date']}")
-            for p in users_data[username]['problems']:
-                print(f"  - {p['date']}: {p['number']}번 {p['title']}")
-        
-        if users_data[username]['problems']:
-            users_data[username]['last_update'] = users_data[username]['problems'][-1]['date']
+    # 폴더 목록은 순서대로 모으고, 문제별 처리는 한꺼번에 (병렬) 수행
+    user_readmes = [
+        (user_folder.name, list_problem_readmes(user_folder, staged))
+        for user_folder in base_path.iterdir()
+        if is_user_folder(user_folder) and (staged is None or user_folder.name in staged.user_folders)
+    ]
+    all_readmes = [problem_readme for _, readmes in user_readmes for problem_readme in readmes]
+    
+    # 히스토리를 한 번만 읽어 경로별 최초 커밋 시간 인덱스 생성 (원장에 있는 문제는 제외)
+    if history is None:
+        with metrics.phase('git_history'):
+            history = build_history(all_readmes, ledger)
+    results = iter(scan_problems(all_readmes, history, workers, ledger, staged))
+    
+    for username, readmes in user_readmes:
+        problems = [problem_info for problem_info in (next(results) for _ in readmes) if problem_info]
+        users_data[username] = build_user_data(username, problems)
     
     return users_data
 
-def calculate_missing_weekdays(problems):
-    """첫 번째 문제부터 현재까지 빼먹은 평일 계산"""
-    if not problems:
-        return 0, 0, []
+def scan_user_folders_incremental(state, changed_paths, workers=1, ledger=None):
+    """이전 상태를 재사용하고 변경된 문제 폴더만 다시 스캔"""
+    base_path = Path('.')
+    users_data = {}
     
-    from datetime import date, timedelta
+    # 변경된 경로가 속한 사용자 / 문제 폴더
+    affected_users = {path.split('/', 1)[0] for path in changed_paths}
+    touched_problems = {'/'.join(path.split('/')[:2]) for path in changed_paths if path.count('/') >= 2}
     
-    # 문제 날짜들을 date 객체로 변환
-    problem_dates = set()
-    for problem in problems:
-        try:
-            problem_date = datetime.strptime(problem['date'], '%Y-%m-%d').date()
-            problem_dates.add(problem_date)
-        except:
+    rescanned = {}
+    for user_folder in base_path.iterdir():
+        if not is_user_folder(user_folder):
             continue
+        username = user_folder.name
+        if username in state.users and username not in affected_users:
+            # 변경 없는 사용자: 저장된 문제 목록 그대로 사용
+            users_data[username] = state.user_data(username)
+            continue
+        
+        affected_users.add(username)
+        problems = []
+        for problem_readme in list_problem_readmes(user_folder):
+            key = problem_readme.parent.as_posix()
+            cached = state.problems.get(key)
+            if cached is not None and key not in touched_problems:
+                problems.append(ProblemInfo.from_dict(cached))
+            else:
+                rescanned[problem_readme] = None
+                problems.append(problem_readme)
+        users_data[username] = problems
     
-    if not problem_dates:
-        return 0, 0, []
-    
-    # 첫 번째 문제 날짜부터 오늘까지 (한국 시간 기준)
-    start_date = min(problem_dates)
-    end_date = get_korea_today()
-    
-    # 시작일이 오늘 이후면 아직 계산할 게 없음
-    if start_date > get_korea_today():
-        return 0, 0, []
-    
-    # 평일 날짜들 생성 (월~금)
-    weekdays = []
-    current_date = start_date
-    while current_date <= end_date:
-        if current_date.weekday() < 5:  # 0=월요일, 4=금요일
-            weekdays.append(current_date)
-        current_date += timedelta(days=1)
-    
-    # 빼먹은 평일들 (오늘은 아직 할 수 있으니 제외)
-    today = get_korea_today()
-    missing_weekdays = []
-    for day in weekdays:
-        if day not in problem_dates and day != today:  # 오늘은 빼먹은 날에서 제외
-            missing_weekdays.append(day)
-    
-    return len(weekdays), len(missing_weekdays), missing_weekdays
-
-def update_user_readme(username, user_data):
-    """개별 사용자의 README 업데이트"""
-    readme_path = Path(username) / 'README.md'
+    # 다시 읽어야 하는 문제들만 한 번의 pathspec 제한 git log로 날짜 조회
+    with metrics.phase('git_history'):
+        history = build_history(list(rescanned), ledger, limit_paths=True)
+    for problem_readme, problem_info in zip(list(rescanned), scan_problems(list(rescanned), history, workers, ledger)):
+        rescanned[problem_readme] = problem_info
     
-    # 빼먹은 평일 계산
-    total_weekdays, missing_count, missing_dates = calculate_missing_weekdays(user_data['problems'])
+    for username in affected_users:
+        if username in users_data:
+            problems = [rescanned[p] if isinstance(p, Path) else p for p in users_data[username]]
+            problems = [p for p in problems if p]
+            users_data[username] = build_user_data(username, problems)
     
-    # README 내용 생성
-    content = f"""# 📚 {username}의 백준 스터디 기록
-
-> 🎯 **매일 꾸준히 성장하기!**
+    log.info(f"♻️ 증분 스캔: 사용자 {len(affected_users & set(users_data))}명, 문제 {len(rescanned)}개 다시 처리")
+    return users_data, affected_users
 
----
-
-## 📅 풀이 기록
+def fill_ledger(users_data, ledger, current_blobs):
+    """상태 파일에서 가져온 문제 중 원장에 없는 커밋된 문제의 날짜를 원장에 기록"""
+    missing = [
+        Path(problem.folder) / 'README.md'
+        for user_data in users_data.values() for problem in user_data.problems
+        if problem.folder not in ledger and current_blobs.get(problem.folder, 'untracked') != 'untracked'
+    ]
+    if not missing:
+        return
+    with metrics.phase('git_history'):
+        history = build_history(missing, ledger)
+    for problem_readme in missing:
+        first_commit = history.first_commit_time(problem_readme.as_posix())
+        if first_commit:
+            ledger.record(problem_readme.parent.as_posix(), resolve_commit_date(problem_readme.parent.name, first_commit))
 
-"""
+def verify_ledger(ledger, current_blobs):
+    """전체 히스토리로 원장을 다시 만들어 커밋된 원장과 비교 (같으면 True)"""
+    if shallow_commits():
+        log.error("❌ 얕은 클론에서는 원장을 검증할 수 없음 (git fetch --unshallow 후 다시 실행)")
+        return False
+    history = GitHistoryIndex.build('.')
+    if not history.available:
+        log.error("❌ git 히스토리를 읽을 수 없음")
+        return False
     
-    # 문제 목록 추가
-    for problem in user_data['problems']:
-        difficulty_display = problem.get('difficulty', 'Unknown')
-        
-        content += f"- {problem['date']}: {problem['number']}번 ({problem['title']})"
-        if difficulty_display != "Unknown":
-            content += f" {difficulty_display}"
-        content += "\n"
+    # 원장에 있는 문제 + 지금 트리에 커밋되어 있는 문제만 비교 (삭제된 지 오래된 문제는 제외)
+    folders = set(ledger.dates) | {key for key, blob in (current_blobs or {}).items() if blob != 'untracked'}
+    rebuilt = {}
+    for folder in folders:
+        first_commit = history.first_commit_time(f"{folder}/README.md")
+        if first_commit:
+            rebuilt[folder] = resolve_commit_date(folder, first_commit)
     
-    # 통계 섹션 추가
-    if user_data['problems']:
-        first_date = user_data['problems'][0]['date']
-        
-        # 실제로 문제를 푼 평일 계산
-        problem_dates = set()
-        for problem in user_data['problems']:
-            try:
-                problem_date = datetime.strptime(problem['date'], '%Y-%m-%d').date()
-                if problem_date.weekday() < 5:  # 평일만
-                    problem_dates.add(problem_date)
-            except:
-                continue
-        
-        actual_success_days = len(problem_dates)  # 실제로 문제를 푼 평일 수
-        total_evaluated_days = actual_success_days + missing_count  # 성공 + 실패 = 평가된 총 일수
-        success_rate = ((actual_success_days) / total_evaluated_days * 100) if total_evaluated_days > 0 else 0
-        
-        # 계산된 통계를 user_data에 저장 (전체 README에서 재사용)
-        user_data['stats'] = {
-            'first_date': first_date,
-            'total_weekdays': total_weekdays,
-            'success_days': actual_success_days,
-            'failure_days': missing_count,
-            'success_rate': success_rate
-        }
-        
-        content += f"""
----
+    differences = 0
+    for folder in sorted(folders, key=lambda key: (ledger.get(key) or rebuilt.get(key) or '', key)):
+        recorded, expected = ledger.get(folder), rebuilt.get(folder)
+        if recorded == expected:
+            continue
+        differences += 1
+        user, _, problem = folder.partition('/')
+        if recorded:
+            print(f"-{user}\t{problem}\t{recorded}")
+        if expected:
+            print(f"+{user}\t{problem}\t{expected}")
+    if differences:
+        log.error(f"❌ 원장과 전체 히스토리가 {differences}건 다름 (-: 원장, +: 히스토리)")
+        return False
+    log.info(f"✅ 원장 검증 완료: {len(ledger)}건 모두 전체 히스토리와 일치")
+    return True
 
-## 📊 스터디 통계
+def build_attendance(user_data, calendar=None):
+    """사용자 기록으로 첫 풀이일 ~ 오늘 출석 비트맵 생성 (풀이가 없으면 None)"""
+    if calendar is None:
+        calendar = StudyCalendar()
+    return Attendance.from_ordinals(user_data.solve_days(), get_korea_today(), calendar, user_data.username)
 
-- **📅 시작일**: {first_date}
-- **📈 총 풀이 문제**: {user_data['total_count']}개
-- **⏱️ 도전 기간**: {total_weekdays}일째 도전 중!
-- **✅ 성공한 날**: {actual_success_days}일
-- **❌ 실패한 날**: {missing_count}일
-- **🎯 출석률**: {success_rate:.1f}%"""
+def calculate_missing_weekdays(user_data, calendar=None):
+    """첫 번째 문제부터 현재까지 빼먹은 평일 계산
 
-        if missing_dates and len(missing_dates) <= 10:  # 너무 많으면 표시하지 않음
-            missing_str = ", ".join([d.strftime('%m-%d') for d in missing_dates[-5:]])  # 최근 5개만
-            if len(missing_dates) > 5:
-                missing_str += f" (외 {len(missing_dates)-5}일)"
-            content += f"\n- **📝 최근 빼먹은 날**: {missing_str}"
-        
-        content += "\n"
-    else:
-        # 문제를 풀지 않은 경우 기본값 저장
-        user_data['stats'] = {
+    (평가일 수, 빼먹은 날 수, 최근 빼먹은 날 최대 5개)를 반환
+    """
+    attendance = build_attendance(user_data, calendar)
+    if attendance is None:
+        return 0, 0, []
+    return attendance.business_days(), attendance.missed_days(), attendance.recent_missed()
+
+def user_stats(user_data, attendance):
+    """사용자 기록과 출석 기록으로 README 통계 dict 생성 (출석 기록의 오늘 기준)"""
+    if not user_data.problems:
+        # 문제를 풀지 않은 경우 기본값
+        return {
             'first_date': None,
             'total_weekdays': 0,
             'success_days': 0,
             'failure_days': 0,
-            'success_rate': 0
+            'success_rate': 0,
+            'current_streak': 0,
+            'longest_streak': 0,
+            'fine': 0
         }
-        
-        content += f"""
----
+    if attendance is None:
+        # 첫 풀이일이 오늘 이후인 경우
+        total_weekdays = success_days = missing_count = current_streak = longest_streak = fine = 0
+        success_rate = 0
+    else:
+        total_weekdays = attendance.business_days()
+        success_days = attendance.attended_days()
+        missing_count = attendance.missed_days()
+        success_rate = attendance.success_rate()
+        current_streak = attendance.current_streak()
+        longest_streak = attendance.longest_streak()
+        fine = attendance.fine()
+    return {
+        'first_date': user_data.problems[0].date,
+        'total_weekdays': total_weekdays,
+        'success_days': success_days,
+        'failure_days': missing_count,
+        'success_rate': success_rate,
+        'current_streak': current_streak,
+        'longest_streak': longest_streak,
+        'fine': fine
+    }
 
-**📊 아직 문제를 풀지 않았습니다. 첫 문제를 풀어보세요!**
-"""
+def render_problem_line(problem):
+    """풀이 기록 한 줄 ('- 날짜: 번호번 (제목) 난이도')"""
+    line = f"- {problem.date}: {problem.number}번 ({problem.title})"
+    if problem.difficulty != "Unknown":
+        line += f" {problem.difficulty}"
+    return line
+
+def group_by_month(problems):
+    """날짜순 문제 목록을 'YYYY-MM' -> 문제 목록으로 묶음 (오래된 달부터)"""
+    months = {}
+    for problem in problems:
+        months.setdefault(problem.date[:7], []).append(problem)
+    return months
+
+def month_title(month):
+    """'2025-07' -> '2025년 07월'"""
+    year, _, mon = month.partition('-')
+    return f"{year}년 {mon}월"
+
+def render_user_readme(username, user_data, calendar=None, sharded=False):
+    """개별 사용자의 README 내용 생성 (통계는 user_data.stats에 저장)
+
+    sharded면 이번 달 풀이만 목록으로 보여주고 지난 달은 history/YYYY-MM.md 링크로 대신한다.
+    """
+    if calendar is None:
+        calendar = StudyCalendar()
     
-    content += f"""
----
+    # 출석 비트맵 한 번으로 모든 출석 통계 계산
+    attendance = build_attendance(user_data, calendar)
+    
+    # README 내용은 줄 목록으로 모은 뒤 마지막에 한 번만 합침
+    lines = [
+        f"# 📚 {username}의 백준 스터디 기록",
+        "",
+        "> 🎯 **매일 꾸준히 성장하기!**",
+        "",
+        "---",
+        "",
+        "## 📅 풀이 기록",
+        "",
+    ]
+    
+    # 문제 목록 추가
+    if sharded:
+        current_month = get_korea_today().strftime('%Y-%m')
+        months = group_by_month(user_data.problems)
+        lines += [f"### {month_title(current_month)}", ""]
+        lines += [render_problem_line(problem) for problem in months.pop(current_month, [])] or ["- 이번 달 풀이 없음"]
+        if months:
+            lines += ["", "### 🗂️ 지난 기록", ""]
+            lines += [
+                f"- [{month_title(month)}]({ARCHIVE_DIR}/{month}.md): {len(problems)}문제"
+                for month, problems in reversed(list(months.items()))
+            ]
+    else:
+        lines += [render_problem_line(problem) for problem in user_data.problems]
+    
+    # 계산된 통계를 user_data에 저장 (전체 README에서 재사용)
+    user_data.stats = stats = user_stats(user_data, attendance)
+    
+    # 통계 섹션 추가
+    if user_data.problems:
+        first_date = stats['first_date']
+        total_weekdays = stats['total_weekdays']
+        actual_success_days = stats['success_days']  # 실제로 문제를 푼 평일 수
+        missing_count = stats['failure_days']
+        success_rate = stats['success_rate']
+        current_streak = stats['current_streak']
+        longest_streak = stats['longest_streak']
+        fine = stats['fine']
+        missing_dates = attendance.recent_missed() if attendance is not None else []
+        
+        lines += [
+            "",
+            "---",
+            "",
+            "## 📊 스터디 통계",
+            "",
+            f"- **📅 시작일**: {first_date}",
+            f"- **📈 총 풀이 문제**: {user_data.total_count}개",
+            f"- **⏱️ 도전 기간**: {total_weekdays}일째 도전 중!",
+            f"- **✅ 성공한 날**: {actual_success_days}일",
+            f"- **❌ 실패한 날**: {missing_count}일",
+            f"- **🎯 출석률**: {success_rate:.1f}%",
+            f"- **🔥 연속 출석**: {current_streak}일 (최장 {longest_streak}일)",
+            f"- **💰 누적 벌금**: {fine:,}원",
+        ]
 
-**총 풀이 문제: {user_data['total_count']}개**
-"""
+        # 1주 전 출석률 (비트맵에서 그 날짜 기준으로 바로 조회)
+        week_ago = get_korea_today() - timedelta(days=7)
+        if attendance is not None and attendance.start <= week_ago:
+            lines.append(f"- **🗓️ 1주 전 출석률**: {attendance.success_rate(week_ago):.1f}%")
+
+        if missing_dates and missing_count <= 10:  # 너무 많으면 표시하지 않음
+            missing_str = ", ".join([d.strftime('%m-%d') for d in missing_dates])  # 최근 5개만
+            if missing_count > 5:
+                missing_str += f" (외 {missing_count-5}일)"
+            lines.append(f"- **📝 최근 빼먹은 날**: {missing_str}")
+    else:
+        lines += ["", "---", "", "**📊 아직 문제를 풀지 않았습니다. 첫 문제를 풀어보세요!**"]
+    
+    lines += ["", "---", "", f"**총 풀이 문제: {user_data.total_count}개**"]
     
-    if user_data['last_update']:
-        content += f"**마지막 업데이트: {user_data['last_update']}**\n"
+    if user_data.last_update:
+        lines.append(f"**마지막 업데이트: {user_data.last_update}**")
     
-    # 파일 쓰기
-    with open(readme_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    return "\n".join(lines) + "\n"
 
-def update_main_readme(users_data):
-    """메인 README의 참여자 테이블 업데이트"""
-    readme_path = Path('README.md')
+def month_digest(username, problems):
+    """한 달치 풀이 기록의 지문 (이 값이 같으면 보관 파일을 다시 만들 필요 없음)
+
+    제목에 사용자 이름이 들어가므로 이름도 포함한다 (폴더 이름을 바꾸면 다시 생성).
+    """
+    digest = hashlib.sha1(f"v{ARCHIVE_VERSION}\n{username}\n".encode('utf-8'))
+    for problem in problems:
+        digest.update(f"{problem.date}\t{problem.number}\t{problem.title}\t{problem.tier}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+def render_month_archive(username, month, problems, digest):
+    """지난 달 풀이 기록 보관 파일 내용"""
+    lines = [
+        f"{ARCHIVE_DIGEST_PREFIX}{digest} -->",
+        f"# 📚 {username}의 풀이 기록 - {month_title(month)}",
+        "",
+        "[← 돌아가기](../README.md)",
+        "",
+        "---",
+        "",
+    ]
+    lines += [render_problem_line(problem) for problem in problems]
+    lines += ["", "---", "", f"**이 달의 풀이: {len(problems)}개**"]
+    return "\n".join(lines) + "\n"
+
+def update_month_archives(username, user_data):
+    """지난 달 보관 파일 갱신 - 지문이 같은 달은 읽기 한 줄로 건너뛰고, 없어진 달의 파일은 삭제"""
+    archive_dir = Path(username) / ARCHIVE_DIR
+    current_month = get_korea_today().strftime('%Y-%m')
+    months = group_by_month(user_data.problems)
+    months.pop(current_month, None)
     
-    if not readme_path.exists():
-        return
+    for month, problems in months.items():
+        path = archive_dir / f"{month}.md"
+        digest = month_digest(username, problems)
+        if read_first_line(path) == f"{ARCHIVE_DIGEST_PREFIX}{digest} -->":
+            continue
+        write_if_changed(path, render_month_archive(username, month, problems, digest))
     
-    with open(readme_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    remove_month_archives(username, keep=months)
+
+def remove_month_archives(username, keep=()):
+    """keep에 없는 달의 보관 파일 삭제 (바뀐 파일 목록에 기록), 비면 history 폴더도 삭제"""
+    archive_dir = Path(username) / ARCHIVE_DIR
+    if not archive_dir.is_dir():
+        return
+    for path in archive_dir.glob('*.md'):
+        if path.stem not in keep:
+            remove_file(path)
+    if not keep and not any(archive_dir.iterdir()):
+        archive_dir.rmdir()
+
+def update_user_readme(username, user_data, calendar=None, sharded=False):
+    """개별 사용자의 README 업데이트 (내용이 바뀐 경우에만 기록, 기록 여부 반환)
+
+    sharded가 아니면 이전 sharded 실행이 남긴 보관 파일을 지워 README에 없는 링크가 남지 않게 한다.
+    """
+    readme_path = Path(username) / 'README.md'
+    content = render_user_readme(username, user_data, calendar, sharded)
+    if sharded:
+        update_month_archives(username, user_data)
+    else:
+        remove_month_archives(username)
+    return write_if_changed(readme_path, content)
+
+def render_catalog_sections(catalog, limit=5):
+    """카탈로그에서 '많이 푼 문제'와 '티어별 분포' 섹션 생성"""
+    lines = ["## 🔥 많이 푼 문제", "", "| 문제 | 난이도 | 푼 사람 |", "|------|--------|---------|"]
+    for entry in catalog.most_solved(limit):
+        solvers = ", ".join(entry.sorted_solvers())
+        lines.append(f"| [{entry.number}. {entry.title}](https://www.acmicpc.net/problem/{entry.number}) "
+                     f"| {entry.difficulty} | {len(entry.solvers)}명 ({solvers}) |")
     
-    # 전체 스터디 통계 계산 (개별 사용자 통계 사용)
+    lines += ["", "## 🏅 티어별 분포", "", "| 티어 | 문제 수 | 풀이 수 |", "|------|---------|---------|"]
+    for group, (problem_count, solve_count) in catalog.tier_distribution().items():
+        lines.append(f"| {group} | {problem_count}문제 | {solve_count}회 |")
+    return "\n".join(lines) + "\n"
+
+def study_summary(users_data, calendar):
+    """전체 스터디 통계 (시작일, 도전 기간, 총 풀이 수, 총 벌금) - 개별 사용자 통계 사용"""
     all_first_dates = []
     total_problems_all = 0
+    total_fine = 0
     
-    for username, data in users_data.items():
-        if data['problems'] and 'stats' in data:
-            first_date = data['stats']['first_date']
-            if first_date:
-                all_first_dates.append(datetime.strptime(first_date, '%Y-%m-%d').date())
+    for data in users_data.values():
+        if data.problems and data.stats is not None:
+            first_day = data.first_day
+            if first_day:
+                all_first_dates.append(first_day)
             
-            total_problems_all += data['total_count']
+            total_problems_all += data.total_count
+            total_fine += data.stats['fine']
     
     if all_first_dates:
-        study_start_date = min(all_first_dates).strftime('%Y-%m-%d')
-        
-        # 전체 도전 기간 계산 (한국 시간 기준)
+        # 전체 도전 기간 계산 (한국 시간 기준), 평일만 (휴일 제외) 닫힌 식으로 계산
         start_date = min(all_first_dates)
-        end_date = get_korea_today()
-        
-        total_weekdays_all = 0
-        current_date = start_date
-        while current_date <= end_date:
-            if current_date.weekday() < 5:  # 평일만
-                total_weekdays_all += 1
-            current_date += timedelta(days=1)
+        total_weekdays_all = calendar.count_business_days(start_date, get_korea_today())
     else:
-        study_start_date = "아직 시작 안함"
+        start_date = None
         total_weekdays_all = 0
     
+    return {
+        'study_start': start_date.strftime('%Y-%m-%d') if start_date else None,
+        'total_weekdays': total_weekdays_all,
+        'total_problems': total_problems_all,
+        'total_fine': total_fine,
+    }
+
+def update_main_readme(users_data, calendar=None, catalog=None):
+    """메인 README의 참여자 테이블 업데이트 (내용이 바뀐 경우에만 기록, 기록 여부 반환)"""
+    readme_path = Path('README.md')
+    
+    if calendar is None:
+        calendar = StudyCalendar()
+    if catalog is None:
+        catalog = ProblemCatalog.build(users_data)
+    
+    if not readme_path.exists():
+        return False
+    
+    with open(readme_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    metrics.count('files_read')
+    
+    # 전체 스터디 통계 계산 (개별 사용자 통계 사용)
+    summary = study_summary(users_data, calendar)
+    study_start_date = summary['study_start'] or "아직 시작 안함"
+    total_weekdays_all = summary['total_weekdays']
+    total_problems_all = summary['total_problems']
+    total_fine = summary['total_fine']
+    
     # 참여자 테이블 생성 (개인별 상세 통계 포함)
-    table_content = """| 이름 | 시작일 | 풀이 문제 수 | 성공한 날 | 실패한 날 | 출석률 | 최근 활동 |
-|------|--------|-------------|----------|----------|--------|-----------|
+    table_content = """| 이름 | 시작일 | 풀이 문제 수 | 성공한 날 | 실패한 날 | 출석률 | 연속 출석 | 벌금 | 최근 활동 |
+|------|--------|-------------|----------|----------|--------|-----------|------|-----------|
 """
     
     for username, data in users_data.items():
-        last_activity = data['last_update'] if data['last_update'] else "-"
+        last_activity = data.last_update if data.last_update else "-"
         
-        if data['problems'] and 'stats' in data:
+        if data.problems and data.stats is not None:
             # 저장된 통계 사용
-            stats = data['stats']
+            stats = data.stats
             start_date = stats['first_date']
             success_days = stats['success_days']
             failure_days = stats['failure_days']
             attendance_rate = stats['success_rate']
+            streak = f"{stats['current_streak']}일 (최장 {stats['longest_streak']}일)"
             
-            table_content += f"| {username} | {start_date} | {data['total_count']}문제 | {success_days}일 | {failure_days}일 | {attendance_rate:.1f}% | {last_activity} |\n"
+            table_content += f"| {username} | {start_date} | {data.total_count}문제 | {success_days}일 | {failure_days}일 | {attendance_rate:.1f}% | {streak} | {stats['fine']:,}원 | {last_activity} |\n"
         else:
-            table_content += f"| {username} | - | 0문제 | 0일 | 0일 | - | {last_activity} |\n"
+            table_content += f"| {username} | - | 0문제 | 0일 | 0일 | - | - | 0원 | {last_activity} |\n"
     
-    # 기존 참여자 섹션부터 끝까지 모든 자동 생성 콘텐츠 제거
-    participants_start_pattern = r'\n## 👥 참여자.*'
-    content = re.sub(participants_start_pattern + r'.*$', '', content, flags=re.DOTALL)
+    # 기존 참여자 섹션부터 끝까지 모든 자동 생성 콘텐츠 제거 (마커 위치로 자르기)
+    marker_offset = content.find(GENERATED_SECTION_MARKER)
+    if marker_offset >= 0:
+        content = content[:marker_offset]
+    else:
+        content += "\n"
     
     # 진행 현황 업데이트 (한국 시간 기준)
     today_str = get_korea_now().strftime('%Y년 %m월 %d일')
     
     # 새로운 섹션 생성
-    if users_data and all_first_dates:
+    if users_data and summary['study_start']:
         new_section = f"""
-
 ## 👥 참여자
 
 {table_content}
@@ -447,7 +694,10 @@ def update_main_readme(users_data):
 - **📈 총 풀이 문제**: {total_problems_all}개
 - **⏱️ 도전 기간**: {total_weekdays_all}일째 도전 중!
 - **👥 참여자 수**: {len(users_data)}명
+- **💰 누적 벌금 합계**: {total_fine:,}원
+- **🧩 서로 다른 문제**: {len(catalog)}개
 
+{render_catalog_sections(catalog)}
 ---
 
 ## 📈 진행 현황
@@ -456,7 +706,6 @@ def update_main_readme(users_data):
 """
     else:
         new_section = f"""
-
 ## 👥 참여자
 
 {table_content}
@@ -474,27 +723,348 @@ def update_main_readme(users_data):
     # 새로운 섹션 추가
     content += new_section
     
-    with open(readme_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    return write_if_changed(readme_path, content)
+
+def rescan_user(username, user_data, history, changed_folders, keep_dates=False, staged=None):
+    """사용자 한 명의 문제 목록을 다시 구성 (바뀐 문제 폴더만 다시 파싱)
 
-def main():
-    print("🔍 폴더 구조 스캔 중...")
+    keep_dates가 True면 이미 알고 있던 문제는 다시 파싱해도 기존 풀이 날짜를 유지한다.
+    staged가 있으면 작업 폴더 대신 스테이징된 내용을 읽는다.
+    """
+    cached = {problem.folder: problem for problem in (user_data.problems if user_data is not None else [])}
+    problems = []
+    for problem_readme in list_problem_readmes(Path(username), staged):
+        folder = problem_readme.parent.as_posix()
+        if folder in cached and folder not in changed_folders:
+            problems.append(cached[folder])
+            continue
+        if keep_dates and folder in cached:
+            problem_info = read_problem(problem_readme, staged)
+            if problem_info:
+                problem_info.folder = folder
+                problem_info.date = cached[folder].date
+        else:
+            problem_info = scan_problem(problem_readme, history, staged=staged)
+        if problem_info:
+            problems.append(problem_info)
+    return build_user_data(username, problems)
+
+def watch(args, calendar):
+    """문제 README 변경을 감시하며 바뀐 사용자 README와 메인 README만 다시 생성"""
+    from readme_watch import create_watcher
+
+    # 처음 한 번은 전체 생성, 이후에는 메모리에 있는 데이터를 계속 재사용
+    history = GitHistoryIndex.build('.')
+    head = (run_git(['rev-parse', 'HEAD']) or '').strip()
+    users_data = scan_user_folders(history, args.workers)
+    for username, user_data in users_data.items():
+        update_user_readme(username, user_data, calendar, args.sharded)
+    update_main_readme(users_data, calendar, ProblemCatalog.build(users_data))
+    rendered_day = get_korea_today()
+
+    watcher = create_watcher(interval=args.poll_interval, polling=args.polling)
+    log.info("⌨️ Ctrl+C로 종료")
     try:
-        users_data = scan_user_folders()
-        print(f"📊 발견된 사용자: {list(users_data.keys())}")
-        
-        # 각 사용자의 README 업데이트
+        while True:
+            changed_paths = watcher.wait()
+            started = datetime.now()
+            reset_run_clock()
+            del changed_files[:]
+
+            # 감시 중에 새로 커밋된 문제가 있으면 그 경로들만 커밋 시간 조회
+            current_head = (run_git(['rev-parse', 'HEAD']) or '').strip()
+            if current_head != head:
+                unknown = [path for path in changed_paths if history.first_commit_time(path) is None]
+                history.first_commits.update(GitHistoryIndex.build('.', paths=unknown).first_commits)
+                head = current_head
+
+            changed_folders = {path.rsplit('/', 1)[0] for path in changed_paths}
+            affected_users = {path.split('/', 1)[0] for path in changed_paths}
+            if get_korea_today() != rendered_day:
+                # 날짜가 바뀌면 모든 사용자의 출석 통계가 달라짐
+                affected_users |= set(users_data)
+                rendered_day = get_korea_today()
+
+            # 사용자 폴더가 생기거나 없어지면 전체 실행과 같은 폴더 순서로 다시 맞춤
+            user_folders = [folder.name for folder in Path('.').iterdir() if is_user_folder(folder)]
+            if list(users_data) != user_folders:
+                affected_users |= set(user_folders) - set(users_data)
+                users_data = {username: users_data.get(username) for username in user_folders}
+            for username in sorted(affected_users & set(users_data)):
+                users_data[username] = rescan_user(username, users_data[username], history, changed_folders)
+                update_user_readme(username, users_data[username], calendar, args.sharded)
+            update_main_readme(users_data, calendar, ProblemCatalog.build(users_data))
+
+            elapsed = (datetime.now() - started).total_seconds() * 1000
+            written = ', '.join(changed_files) or '변경 없음'
+            log.info(f"🔄 {', '.join(sorted(changed_paths))} → {written} ({elapsed:.0f}ms)")
+    except KeyboardInterrupt:
+        log.info("👋 감시 종료")
+    finally:
+        watcher.close()
+
+def hook_update(calendar, today, staged, sharded=False):
+    """pre-commit 훅: 스테이징된 사용자 폴더의 README와 메인 README만 다시 생성
+
+    문제 목록과 내용은 작업 폴더가 아니라 staged(인덱스)에서 읽으므로 커밋에 없는 풀이는 들어가지 않는다.
+    다른 참여자의 데이터는 상태 파일에서 가져오므로 히스토리 길이와 관계없이 빠르다.
+    무엇이 바뀌었는지 알 수 없으면 False를 반환한다 (호출한 쪽에서 전체 실행).
+    """
+    from commit_hook import committer_folder, load_user_mapping, staged_changes
+
+    changes = staged_changes()
+    if changes is None:
+        log.warn("⚠️ 스테이징된 변경을 가져올 수 없음, 전체 실행")
+        return False
+
+    # 스테이징된 경로 -> 사용자 폴더 (루트 README, .github, 자동 생성 README는 무시)
+    users = set()
+    unattributed = []
+    for path in changes:
+        parts = path.split('/')
+        if parts[0].startswith('.') or path == 'README.md' or parts[1:] == ['README.md']:
+            continue
+        if len(parts) > 2 and parts[1] == ARCHIVE_DIR:
+            continue
+        if len(parts) == 1:
+            unattributed.append(path)
+        else:
+            users.add(parts[0])
+    if unattributed:
+        # 사용자 폴더 밖의 파일은 커밋하는 참여자의 것으로 보고 매핑 파일로 폴더를 찾음
+        folder = committer_folder(load_user_mapping())
+        if folder is None:
+            log.warn(f"⚠️ {', '.join(unattributed)}: 참여자 폴더를 알 수 없음, 전체 실행")
+            return False
+        users.add(folder)
+    if not users:
+        log.info("📝 README에 영향을 주는 스테이징 변경 없음")
+        return True
+
+    state = ReadmeState.load()
+    if state is None:
+        log.warn("⚠️ 사용 가능한 상태 파일 없음, 전체 실행")
+        return False
+    user_folders = [folder.name for folder in Path('.').iterdir()
+                    if is_user_folder(folder) and folder.name in staged.user_folders]
+    unknown = (set(user_folders) ^ set(state.users)) - users
+    if unknown:
+        log.warn(f"⚠️ 상태 파일에 없는 사용자 폴더 변경 ({', '.join(sorted(unknown))}), 전체 실행")
+        return False
+
+    # 상태 파일에 없는 문제: 상태 이후 커밋에 있으면 그 커밋 시간, 없으면 지금 커밋되는 것으로 봄
+    new_readmes = [
+        problem_readme.as_posix()
+        for username in users if username in user_folders
+        for problem_readme in list_problem_readmes(Path(username), staged)
+        if problem_readme.parent.as_posix() not in state.problems
+    ]
+    history = GitHistoryIndex()
+    head = (run_git(['rev-parse', 'HEAD']) or '').strip()
+    if new_readmes and head != state.commit:
+        history = GitHistoryIndex.build('.', paths=new_readmes, revisions=f"{state.commit}..HEAD")
+        if not history.available:
+            log.warn(f"⚠️ {state.commit[:7]} 이후 히스토리를 읽을 수 없음, 전체 실행")
+            return False
+    pending_commit = get_korea_now().replace(tzinfo=KST_OFFSET).strftime(GIT_TIME_FORMAT)
+    for path in new_readmes:
+        history.first_commits.setdefault(path, pending_commit)
+
+    staged_folders = {'/'.join(path.split('/')[:2]) for path in changes}
+    users_data = {}
+    for username in user_folders:
+        if username in users:
+            cached = state.user_data(username) if username in state.users else None
+            users_data[username] = rescan_user(username, cached, history, staged_folders, keep_dates=True,
+                                                   staged=staged)
+            update_user_readme(username, users_data[username], calendar, sharded)
+        else:
+            users_data[username] = state.user_data(username)
+            if state.stats_date == today and username in state.stats:
+                users_data[username].stats = state.stats[username]
+            else:
+                # 날짜가 바뀌었으면 메인 README 행에 필요한 통계만 메모리에서 다시 계산
+                render_user_readme(username, users_data[username], calendar)
+
+    update_main_readme(users_data, calendar, ProblemCatalog.build(users_data))
+    log.info(f"🪝 훅 업데이트: {', '.join(sorted(users & set(user_folders)))}")
+    return True
+
+def parse_args(argv=None):
+    """명령행 옵션 파싱"""
+    parser = argparse.ArgumentParser(description='사용자 폴더를 스캔하여 README 파일들을 자동 생성')
+    parser.add_argument('--incremental', action='store_true',
+                        help='상태 파일 기준으로 마지막 실행 이후 바뀐 문제 폴더만 다시 처리')
+    parser.add_argument('--full', action='store_true',
+                        help='상태 파일을 무시하고 전체 재빌드')
+    parser.add_argument('--changed-files', metavar='PATH',
+                        help='실제로 내용이 바뀐 파일 목록을 기록할 경로 (커밋 단계에서 git add 대상)')
+    parser.add_argument('--workers', type=int, default=min(8, os.cpu_count() or 1),
+                        help='문제 README 스캔에 사용할 스레드 수 (1이면 순차 처리)')
+    parser.add_argument('--catalog', metavar='PATH',
+                        help='문제 카탈로그(문제 번호별 제목/티어/푼 사람) JSON 스냅샷을 기록할 경로')
+    parser.add_argument('--export', metavar='DIR',
+                        help='대시보드용 stats.json(통계)과 solves.ndjson(풀이 이벤트)을 이 폴더에 기록')
+    parser.add_argument('--metrics', metavar='PATH',
+                        help='실행 요약 JSON을 표준 출력 대신 이 경로에 기록')
+    parser.add_argument('--sharded', action='store_true',
+                        help='개인 README에는 이번 달 풀이만 두고 지난 달은 <user>/history/YYYY-MM.md로 분리')
+    parser.add_argument('--watch', action='store_true',
+                        help='문제 README 변경을 감시하며 해당 사용자 README와 메인 README를 바로 다시 생성')
+    parser.add_argument('--poll-interval', type=float, default=0.3, metavar='SECONDS',
+                        help='--watch 폴링 간격 (watchdog이 없거나 --polling일 때)')
+    parser.add_argument('--polling', action='store_true',
+                        help='--watch에서 watchdog이 있어도 폴링 사용 (네트워크 드라이브 등)')
+    parser.add_argument('--hook', action='store_true',
+                        help='pre-commit 훅 모드: 스테이징된 사용자 README와 메인 README만 갱신하고 스테이징')
+    parser.add_argument('--install-hook', action='store_true',
+                        help='이 저장소에 --hook을 실행하는 pre-commit 훅 설치')
+    parser.add_argument('--verify-ledger', action='store_true',
+                        help='전체 히스토리로 풀이 원장(.github/solves.tsv)을 다시 만들어 비교, 다르면 종료 코드 1')
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument('-q', '--quiet', action='store_true', help='오류와 실행 요약 JSON만 출력')
+    verbosity.add_argument('-v', '--verbose', action='store_true', help='문제별 상세 로그까지 출력')
+    return parser.parse_args(argv)
+
+def prepare_run(args):
+    """실행 전 로그 수준과 실행 단위 상태(지표, 기준 시각, 변경 파일 목록) 초기화"""
+    if args.quiet:
+        log.level = QUIET
+    elif args.verbose:
+        log.level = VERBOSE
+    metrics.reset()
+    reset_run_clock()
+    del changed_files[:]
+
+def run(args):
+    """현재 디렉터리의 저장소에서 README 갱신 한 번 실행
+
+    (실행 모드, users_data)를 반환한다 (감시/훅 모드로 끝나면 users_data는 None).
+    """
+    mode = 'full'
+    log.info("🔍 폴더 구조 스캔 중...")
+    with metrics.phase('setup'):
+        today = get_korea_today().strftime('%Y-%m-%d')
+        calendar = StudyCalendar.load()
+        head = (run_git(['rev-parse', 'HEAD']) or '').strip()
+        current_blobs = problem_blobs()
+        ledger = SolveLedger.load()
+
+    if args.verify_ledger:
+        sys.exit(0 if verify_ledger(ledger, current_blobs) else 1)
+    if args.watch:
+        watch(args, calendar)
+        return 'watch', None
+    staged = None
+    if args.hook:
+        from commit_hook import StagedTree, stage_files
+        # 커밋에 들어갈 내용만 반영하도록 작업 폴더 대신 인덱스에서 읽음 (전체 실행으로 넘어가도 같음)
+        staged = StagedTree.load()
+        with metrics.phase('hook'):
+            handled = staged is not None and hook_update(calendar, today, staged, args.sharded)
+        if handled:
+            staged.close()
+            stage_files(changed_files)
+            if args.metrics:
+                metrics.emit(args.metrics, mode='hook', changed_files=list(changed_files))
+            return 'hook', None
+
+    state = None
+    users_data = None
+    if args.incremental and not args.full and staged is None and head and current_blobs is not None:
+        with metrics.phase('load_state'):
+            state = ReadmeState.load()
+        if state is None:
+            log.warn("⚠️ 사용 가능한 상태 파일 없음, 전체 재빌드")
+    
+    if state is not None:
+        with metrics.phase('scan'):
+            changed_paths = changed_paths_since(state.commit)
+            if changed_paths is None:
+                log.warn(f"⚠️ {state.commit[:7]} 이후 변경 내역을 가져올 수 없음, 전체 재빌드")
+            else:
+                users_data, affected_users = scan_user_folders_incremental(state, changed_paths, args.workers, ledger)
+                mode = 'incremental'
+                if not state.matches_tree(users_data, affected_users, current_blobs):
+                    log.warn("⚠️ 상태 파일이 현재 트리와 일치하지 않음, 전체 재빌드")
+                    users_data = None
+                else:
+                    # 원장이 생기기 전의 상태 파일에서 가져온 문제도 원장에 옮겨 둠
+                    fill_ledger(users_data, ledger, current_blobs)
+    
+    if users_data is None:
+        state = None
+        mode = 'full'
+        with metrics.phase('scan'):
+            users_data = scan_user_folders(workers=args.workers, ledger=ledger, staged=staged)
+        if staged is not None:
+            staged.close()
+        affected_users = set(users_data)
+    log.info(f"📊 발견된 사용자: {list(users_data.keys())}")
+    
+    # 각 사용자의 README 업데이트
+    with metrics.phase('render_users'):
         for username, user_data in users_data.items():
-            print(f"📝 {username}의 README 업데이트 중...")
-            update_user_readme(username, user_data)
-        
-        # 메인 README 업데이트
-        print("📋 메인 README 업데이트 중...")
-        update_main_readme(users_data)
-        
-        print("✅ README 업데이트 완료!")
+            # sharded가 아닌데 보관 파일이 남아 있으면 (이전 sharded 실행) 다시 생성해서 정리
+            leftover_archives = not args.sharded and (Path(username) / ARCHIVE_DIR).is_dir()
+            if (state is not None and username not in affected_users and not leftover_archives
+                    and state.stats_date == today and username in state.stats):
+                # 변경 없는 사용자는 같은 날 계산된 통계를 재사용
+                user_data.stats = state.stats[username]
+                continue
+            log.debug(f"📝 {username}의 README 업데이트 중...")
+            update_user_readme(username, user_data, calendar, args.sharded)
+    
+    # 메인 README 업데이트
+    log.info("📋 메인 README 업데이트 중...")
+    with metrics.phase('catalog'):
+        catalog = ProblemCatalog.build(users_data)
+        if args.catalog:
+            catalog.save(args.catalog)
+    with metrics.phase('render_main'):
+        update_main_readme(users_data, calendar, catalog)
+    if args.export:
+        from stats_export import export_stats
+        with metrics.phase('export'):
+            export_stats(args.export, users_data, catalog, study_summary(users_data, calendar), today)
+    
+    # 새로 확정된 풀이 날짜를 원장에 추가 (훅에서는 커밋 전이라 날짜가 확정되지 않음)
+    if not args.hook:
+        with metrics.phase('ledger'):
+            ledger.save()
+    
+    # 다음 증분 실행을 위한 상태 저장
+    # 훅에서는 아직 커밋되지 않은 내용이 섞이므로 상태 파일을 갱신하지 않음
+    if head and current_blobs is not None and not args.hook:
+        with metrics.phase('save_state'):
+            ReadmeState.from_run(head, users_data, current_blobs, today).save()
+    
+    if changed_files:
+        log.info(f"📝 변경된 파일 {len(changed_files)}개: {', '.join(changed_files)}")
+    else:
+        log.info("📝 변경된 파일 없음")
+    if args.changed_files:
+        write_changed_list(args.changed_files)
+    if args.hook:
+        from commit_hook import stage_files
+        stage_files(changed_files)
+    
+    log.info("✅ README 업데이트 완료!")
+    metrics.emit(args.metrics, mode=mode, users=len(users_data), changed_files=list(changed_files))
+    return mode, users_data
+
+def main(argv=None):
+    args = parse_args(argv)
+    prepare_run(args)
+    if args.install_hook:
+        from commit_hook import install_hook
+        install_hook()
+        return
+    
+    try:
+        run(args)
     except Exception as e:
-        print(f"❌ 에러 발생: {e}")
+        log.error(f"❌ 에러 발생: {e}")
         import traceback
         traceback.print_exc()
 
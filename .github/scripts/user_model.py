@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""참여자 기록 - 문제 레코드 목록과 함께 날짜/티어를 열(array)로 들고 있는 사용자 데이터
+
+    problems : 날짜순 ProblemInfo 목록 (README 렌더링용)
+    ordinals : problems와 같은 순서의 풀이 날짜 일 번호 (date.toordinal, 날짜가 잘못되면 0)
+    tiers    : problems와 같은 순서의 티어 번호 (0: Unknown)
+
+날짜 문자열은 레코드를 만들 때 한 번만 일 번호로 바꾸고, 출석/통계 계산은 이 열만 사용한다.
+"""
+from array import array
+from datetime import date
+
+
+def date_ordinal(value):
+    """'YYYY-MM-DD' -> 일 번호 (형식이 틀리면 0)"""
+    try:
+        return date(int(value[:4]), int(value[5:7]), int(value[8:10])).toordinal()
+    except (TypeError, ValueError):
+        return 0
+
+
+def tier_number(value):
+    """티어 값 -> 0~30 (없거나 범위 밖이면 0)"""
+    return value if isinstance(value, int) and 0 <= value <= 30 else 0
+
+
+class UserRecord:
+    """참여자 한 명의 풀이 기록과 통계 (통계는 README를 만들 때 채워짐)"""
+
+    __slots__ = ('username', 'problems', 'ordinals', 'tiers', 'stats')
+
+    def __init__(self, username, problems, stats=None):
+        # 날짜순 정렬 (같은 날짜는 입력 순서 유지)
+        problems.sort(key=lambda problem: problem.date)
+        self.username = username
+        self.problems = problems
+        self.ordinals = array('l', [date_ordinal(problem.date) for problem in problems])
+        self.tiers = array('B', [tier_number(problem.tier) for problem in problems])
+        self.stats = stats
+
+    @property
+    def total_count(self):
+        return len(self.problems)
+
+    @property
+    def last_update(self):
+        """마지막 풀이 날짜 문자열 (풀이가 없으면 None)"""
+        return self.problems[-1].date if self.problems else None
+
+    @property
+    def first_day(self):
+        """첫 풀이 날짜 (풀이가 없거나 날짜가 잘못되었으면 None)"""
+        valid = [ordinal for ordinal in self.ordinals if ordinal]
+        return date.fromordinal(min(valid)) if valid else None
+
+    def solve_days(self):
+        """문제를 푼 날짜들의 일 번호 집합"""
+        return {ordinal for ordinal in self.ordinals if ordinal}
+
+    def tier_counts(self):
+        """티어 번호별 풀이 수 (길이 31, index 0은 Unknown)"""
+        counts = [0] * 31
+        for tier in self.tiers:
+            counts[tier] += 1
+        return counts
+
+    def __repr__(self):
+        return f"UserRecord({self.username!r}, {self.total_count}문제, 마지막 {self.last_update})"
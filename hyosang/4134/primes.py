@@ -0,0 +1,187 @@
+"""다음 소수 (4134) - 64비트 결정적 밀러-라빈 + 작은 소수 바퀴 필터 + 구간 체
+
+그대로 실행하면 4134번 풀이 (입력 전체를 한 번에 읽고 답을 한 번에 출력):
+    python primes.py < input.txt
+
+다른 풀이에서 모듈로 사용:
+    from primes import is_prime, next_prime, next_primes
+
+기존 시도 나눗셈 풀이(main.py)와 비교:
+    python primes.py --bench
+"""
+import math
+import sys
+
+# 2^64 미만의 모든 수에 대해 결정적인 밀러-라빈 밑 (처음 12개 소수)
+MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+# 바퀴: 2·3·5·7 = 210과 서로소인 나머지만 후보로 검사 (후보가 48/210로 줄어듦)
+WHEEL = 210
+WHEEL_RESIDUES = [r for r in range(WHEEL) if all(r % p for p in (2, 3, 5, 7))]
+# r 이상인 다음 후보까지의 거리 (r = 0..209)
+WHEEL_SKIP = [min((c - r) % WHEEL for c in WHEEL_RESIDUES) for r in range(WHEEL)]
+
+# 밀러-라빈 전에 나눠 보는 작은 소수들 (대부분의 합성수를 여기서 거름)
+SMALL_PRIME_LIMIT = 1000
+
+# 질의들이 이 폭 안에 몰려 있고 질의 수에 비해 폭이 작으면 구간 체 사용
+SIEVE_SPAN_LIMIT = 1 << 22
+SIEVE_SPAN_PER_QUERY = 64
+# 구간 체에 필요한 기저 소수(√high 이하)의 상한 - 넘으면 기저 체가 너무 커지므로 밀러-라빈 사용
+SIEVE_BASE_LIMIT = 1 << 20
+
+
+def simple_sieve(limit):
+    """limit 미만의 소수 목록 (에라토스테네스의 체)"""
+    if limit < 3:
+        return []
+    flags = bytearray([1]) * limit
+    flags[0] = flags[1] = 0
+    for p in range(2, math.isqrt(limit - 1) + 1):
+        if flags[p]:
+            flags[p * p::p] = bytes(len(range(p * p, limit, p)))
+    return [i for i, flag in enumerate(flags) if flag]
+
+
+SMALL_PRIMES = simple_sieve(SMALL_PRIME_LIMIT)
+SMALL_PRIME_SQUARE = SMALL_PRIMES[-1] ** 2
+
+
+def is_prime(n):
+    """n이 소수인지 판별 (n < 2^64에서 결정적)"""
+    if n < 2:
+        return False
+    for p in SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    if n < SMALL_PRIME_SQUARE:
+        return True
+
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in MR_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def next_prime(n):
+    """n 이상인 가장 작은 소수"""
+    if n <= 2:
+        return 2
+    if n < WHEEL:
+        # 바퀴의 소수 자체(3, 5, 7)는 나머지 목록에 없으므로 작은 수는 직접 확인
+        while not is_prime(n):
+            n += 1
+        return n
+    n += WHEEL_SKIP[n % WHEEL]
+    while not is_prime(n):
+        n += 1
+        n += WHEEL_SKIP[n % WHEEL]
+    return n
+
+
+def segmented_sieve(low, high):
+    """[low, high) 구간의 소수 여부 bytearray (index i -> low + i)
+
+    기저 소수로 √high 이하의 체를 만들므로 high가 큰 구간은 호출 전에 SIEVE_BASE_LIMIT로 걸러야 한다.
+    """
+    low = max(low, 0)
+    flags = bytearray([1]) * (high - low)
+    for value in range(low, min(high, 2)):
+        flags[value - low] = 0
+    for p in simple_sieve(math.isqrt(high - 1) + 1):
+        start = max(p * p, (low + p - 1) // p * p)
+        if start < high:
+            flags[start - low::p] = bytes(len(range(start, high, p)))
+    return flags
+
+
+def next_primes(queries):
+    """질의마다 그 수 이상인 가장 작은 소수 (입력 순서대로)
+
+    질의가 좁은 구간에 몰려 있고 기저 소수가 작으면 구간 체 한 번으로, 아니면 질의마다 밀러-라빈으로 처리한다.
+    """
+    queries = list(queries)
+    if not queries:
+        return []
+    low, high = max(min(queries), 2), max(queries)
+    span = high - low + 1
+    if (span <= SIEVE_SPAN_LIMIT and span <= SIEVE_SPAN_PER_QUERY * len(queries)
+            and math.isqrt(high) < SIEVE_BASE_LIMIT):
+        # 가장 큰 질의 뒤의 소수까지 포함하도록 체를 만든 뒤, 뒤에서부터 '다음 소수' 표를 채움
+        end = next_prime(high) + 1
+        flags = segmented_sieve(low, end)
+        following = [0] * len(flags)
+        nearest = end - 1
+        for i in range(len(flags) - 1, -1, -1):
+            if flags[i]:
+                nearest = low + i
+            following[i] = nearest
+        return [following[max(q, 2) - low] for q in queries]
+    return [next_prime(q) for q in queries]
+
+
+def solve(data):
+    """4134번 입력(bytes) -> 출력 문자열"""
+    tokens = data.split()
+    count = int(tokens[0])
+    answers = next_primes(map(int, tokens[1:1 + count]))
+    return '\n'.join(map(str, answers)) + '\n'
+
+
+def bench(count, maximum, seed):
+    """main.py(시도 나눗셈)와 이 풀이를 같은 입력으로 실행해 시간 비교"""
+    import os
+    import random
+    import subprocess
+    import time
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    rng = random.Random(seed)
+    cases = {
+        'random': [rng.randint(0, maximum) for _ in range(count)],
+        'dense': [maximum - rng.randint(0, count * 8) for _ in range(count)],
+    }
+    print(f"{'입력':<8}{'질의 수':>8}{'main.py':>12}{'primes.py':>12}{'배속':>8}  결과")
+    for name, queries in cases.items():
+        data = f"{len(queries)}\n" + '\n'.join(map(str, queries)) + '\n'
+        timings = {}
+        outputs = {}
+        for script in ('main.py', 'primes.py'):
+            started = time.perf_counter()
+            result = subprocess.run([sys.executable, os.path.join(here, script)], input=data,
+                                    capture_output=True, text=True, check=True)
+            timings[script] = time.perf_counter() - started
+            outputs[script] = result.stdout.split()
+        same = '같음' if outputs['main.py'] == outputs['primes.py'] else '다름!'
+        print(f"{name:<8}{len(queries):>8}{timings['main.py']:>11.3f}s{timings['primes.py']:>11.3f}s"
+              f"{timings['main.py'] / timings['primes.py']:>7.1f}x  {same}")
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == '--bench':
+        import argparse
+        parser = argparse.ArgumentParser(description='main.py(시도 나눗셈)와 primes.py 속도 비교')
+        parser.add_argument('--bench', action='store_true')
+        parser.add_argument('--count', type=int, default=300, help='질의 수')
+        parser.add_argument('--max', type=int, default=4 * 10 ** 9, help='질의 최댓값')
+        parser.add_argument('--seed', type=int, default=4134, help='난수 시드')
+        args = parser.parse_args()
+        bench(args.count, args.max, args.seed)
+        return
+    sys.stdout.write(solve(sys.stdin.buffer.read()))
+
+
+if __name__ == '__main__':
+    main()